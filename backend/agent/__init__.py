@@ -1,5 +1,5 @@
 """Agent package providing NL2SQL conversion"""
 
-from .nl2sql import nl2sql
+from .nl2sql import nl2sql, close_client
 
-__all__ = ["nl2sql"]
+__all__ = ["nl2sql", "close_client"]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+import re
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 try:
     import openai
@@ -15,22 +17,123 @@ DEFAULT_SYSTEM_PROMPT = (
     "queries. Only return the SQL query as your answer."
 )
 
+_QUOTE_CHARS = ("'", '"')
+
+# 응답 정리용 정규식 (모듈 로드 시 1회 컴파일)
+_CODE_FENCE_RE = re.compile(r"```[A-Za-z]*")
+# 줄 시작의 대문자 키워드 + 공백만 SQL 시작으로 인정
+# ("With the given schema, ..." 같은 설명문과 스트리밍 중 잘린 토큰 "SHOW|ING"을 제외)
+_SQL_START_RE = re.compile(
+    r"^[ \t]*(SELECT|WITH|INSERT|UPDATE|DELETE|CREATE|ALTER|DROP|PRAGMA|SHOW|DESCRIBE|EXPLAIN)\s",
+    re.MULTILINE,
+)
+
+# (system_prompt, 정규화된 질문) → 생성된 SQL LRU 캐시
+_SQL_CACHE_SIZE = 512
+_sql_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+_client = None
+_client_key: Optional[str] = None
+
+
+def _get_client(api_key: str):
+    """API 키별 AsyncOpenAI 클라이언트 재사용 (HTTP 연결 풀 공유)"""
+    global _client, _client_key
+    if _client is None or _client_key != api_key:
+        _client = openai.AsyncOpenAI(api_key=api_key)
+        _client_key = api_key
+    return _client
+
+
+async def close_client() -> None:
+    """캐시된 클라이언트의 HTTP 연결 풀 해제 (애플리케이션 종료 시 호출)"""
+    global _client, _client_key
+    if _client is not None:
+        client, _client, _client_key = _client, None, None
+        await client.close()
+
+
+def _scan_terminator(text: str, start: int, quote: Optional[str]) -> Tuple[int, Optional[str]]:
+    """따옴표 밖의 첫 ';' 위치와 스캔 종료 시점의 따옴표 상태 반환"""
+    for i in range(start, len(text)):
+        ch = text[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in _QUOTE_CHARS:
+            quote = ch
+        elif ch == ";":
+            return i, quote
+    return -1, quote
+
+
+def _clean_sql(text: str) -> str:
+    """LLM 응답에서 코드 펜스와 SQL 앞의 설명 줄 제거"""
+    text = _CODE_FENCE_RE.sub("", text)
+    match = _SQL_START_RE.search(text)
+    if match:
+        text = text[match.start(1):]
+    return text.strip()
+
+
 async def nl2sql(question: str, *, system_prompt: str = DEFAULT_SYSTEM_PROMPT) -> str:
-    """Convert a natural language question into a SQL query using OpenAI."""
+    """Convert a natural language question into a SQL query using OpenAI.
+
+    The completion is streamed and reading stops as soon as the statement
+    terminator arrives, so trailing explanation tokens are never waited for.
+    Quote tracking starts at the first SQL keyword, so apostrophes in a
+    preamble ("Here's the query:") cannot end the statement mid-literal.
+    Answers are cached per (system prompt, whitespace-normalized question).
+    """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key or openai is None:
         # Fallback when OpenAI is not configured
         return "SELECT 1"
 
-    openai.api_key = api_key
-    response = await openai.ChatCompletion.acreate(
+    cache_key = (system_prompt, " ".join(question.split()))
+    cached = _sql_cache.get(cache_key)
+    if cached is not None:
+        _sql_cache.move_to_end(cache_key)
+        return cached
+
+    stream = await _get_client(api_key).chat.completions.create(
         model="gpt-3.5-turbo",
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": question},
         ],
         temperature=0,
+        stream=True,
     )
-    # Assume the assistant returns the SQL in the first message
-    sql = response.choices[0].message.content.strip()
+
+    buffer = ""
+    sql_start: Optional[int] = None  # 첫 SQL 키워드 위치 (찾기 전에는 종결자 검사 안 함)
+    scanned = 0
+    quote: Optional[str] = None
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            buffer += delta
+            if sql_start is None:
+                match = _SQL_START_RE.search(buffer)
+                if match is None:
+                    continue
+                sql_start = scanned = match.start(1)
+            end, quote = _scan_terminator(buffer, scanned, quote)
+            if end != -1:
+                buffer = buffer[:end + 1]
+                break
+            scanned = len(buffer)
+    finally:
+        await stream.close()
+
+    sql = _clean_sql(buffer)
+    if sql:
+        _sql_cache[cache_key] = sql
+        if len(_sql_cache) > _SQL_CACHE_SIZE:
+            _sql_cache.popitem(last=False)
     return sql
@@ -1,5 +1,9 @@
 """Agent API endpoints"""
 
+import asyncio
+import os
+from dataclasses import asdict
+
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
@@ -9,6 +13,9 @@ from ..agent import nl2sql
 
 router = APIRouter(prefix="/api/agent", tags=["agent"])
 
+# 동시 LLM 호출 상한 (초과 요청은 이벤트 루프를 막지 않고 대기)
+_nl2sql_semaphore = asyncio.Semaphore(int(os.getenv("AGENT_MAX_CONCURRENCY", "8")))
+
 
 class AgentQueryRequest(BaseModel):
     question: str = Field(..., description="Natural language question")
@@ -34,10 +41,11 @@ async def query_via_agent(
 ):
     """Convert question to SQL and execute it."""
     try:
-        sql = await nl2sql(request.question)
+        async with _nl2sql_semaphore:
+            sql = await nl2sql(request.question)
         query_result = await manager.execute_query(sql, request.connection_id, request.params)
         if query_result.success:
-            return AgentQueryResponse(success=True, sql_query=sql, result=query_result.model_dump())
+            return AgentQueryResponse(success=True, sql_query=sql, result=asdict(query_result))
         return AgentQueryResponse(success=False, sql_query=sql, error=query_result.error)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -3,13 +3,20 @@ Database API - MindsDB inspired multi-database endpoints
 다중 데이터베이스 REST API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 from pydantic import BaseModel, Field
+import hashlib
 import logging
+from decimal import Decimal
+import time
+import orjson
 
-from ..database.connection_manager import get_connection_manager, ConnectionManager
+from ..database.connection_manager import ConnectionManager, get_connection_manager
 from ..database.handlers.base_handler import (
     DatabaseType, 
     ConnectionConfig, 
@@ -22,7 +29,40 @@ from ..database.handlers.base_handler import (
 from ..database.handlers.handler_factory import get_supported_databases
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/database", tags=["database"])
+
+
+class DatabaseAPIRoute(APIRoute):
+    """엔드포인트 예외를 공통으로 HTTP 오류로 변환하는 라우트
+    
+    ConnectionError는 400, 그 외 예외는 로깅 후 500으로 응답한다.
+    라우터 내부에서 HTTPException으로 바꾸므로 CORS 헤더가 유지된다.
+    """
+    
+    def get_route_handler(self):
+        route_handler = super().get_route_handler()
+        route_name = self.name
+        
+        async def handler(request: Request):
+            try:
+                return await route_handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except ConnectionError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except Exception as e:
+                logger.error("%s failed: %s", route_name, e, exc_info=True)
+                raise HTTPException(status_code=500, detail=f"{route_name} failed: {e}")
+        
+        return handler
+
+
+# 스키마/쿼리 결과 등 대용량 JSON 응답은 orjson으로 직렬화
+router = APIRouter(
+    prefix="/api/database",
+    tags=["database"],
+    default_response_class=ORJSONResponse,
+    route_class=DatabaseAPIRoute
+)
 
 
 # Pydantic 모델들
@@ -59,6 +99,7 @@ class QueryRequest(BaseModel):
     query: str = Field(..., description="실행할 쿼리")
     connection_id: Optional[str] = Field(None, description="연결 ID (미지정시 활성 연결)")
     params: Optional[Dict[str, Any]] = Field(None, description="쿼리 파라미터")
+    stream: bool = Field(False, description="결과를 NDJSON으로 스트리밍")
 
 
 class ConnectionResponse(BaseModel):
@@ -101,26 +142,152 @@ class SchemaResponse(BaseModel):
     procedures: List[Dict[str, Any]]
 
 
+# 요청 문자열 → DatabaseType (예외 없이 검증)
+_DB_TYPE_MAP = {db_type.value: db_type for db_type in DatabaseType}
+
+def _json_default(value: Any) -> Any:
+    """orjson이 기본 지원하지 않는 DB 값 변환 (jsonable_encoder와 같은 규칙)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).decode("utf-8", errors="replace")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _query_result_body(result: QueryResult) -> bytes:
+    """QueryResult를 모델 검증 없이 QueryResponse 형태의 JSON으로 직렬화"""
+    return orjson.dumps({
+        "success": result.success,
+        "data": result.data,
+        "columns": result.columns,
+        "row_count": result.row_count,
+        "execution_time": result.execution_time,
+        "error": result.error,
+        "metadata": result.metadata
+    }, default=_json_default)
+
+
+# NDJSON 스트리밍 시 한 번에 전송할 행 수
+_STREAM_BATCH_ROWS = 1000
+
+
+async def _ndjson_result(result: QueryResult):
+    """쿼리 결과를 NDJSON으로 직렬화 (첫 줄은 메타데이터, 이후 한 줄에 한 행)"""
+    yield orjson.dumps({
+        "success": result.success,
+        "columns": result.columns,
+        "row_count": result.row_count,
+        "execution_time": result.execution_time,
+        "metadata": result.metadata
+    }, default=_json_default) + b"\n"
+    
+    data = result.data or []
+    for start in range(0, len(data), _STREAM_BATCH_ROWS):
+        yield b"".join(
+            orjson.dumps(row, default=_json_default) + b"\n"
+            for row in data[start:start + _STREAM_BATCH_ROWS]
+        )
+
+
+# 스키마 메타데이터 TTL 캐시 ((종류, 연결 ID, 스키마, 테이블) → (만료 시각, 값))
+_SCHEMA_CACHE_TTL = 60.0
+_SCHEMA_CACHE_MAX = 512
+_schema_cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+# 실행 후 스키마 캐시를 비워야 하는 DDL 쿼리
+_DDL_PREFIXES = ("CREATE", "ALTER", "DROP", "RENAME", "TRUNCATE")
+
+
+async def _cached_schema(key: Tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """TTL 동안 동일 키의 스키마 조회 결과 재사용 (실패한 조회는 캐시하지 않음)"""
+    now = time.monotonic()
+    entry = _schema_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    
+    value = await loader()
+    if len(_schema_cache) >= _SCHEMA_CACHE_MAX:
+        # 만료된 항목 정리 후에도 가득 차 있으면 전부 비움
+        for stale in [k for k, (expires, _) in _schema_cache.items() if expires <= now]:
+            del _schema_cache[stale]
+        if len(_schema_cache) >= _SCHEMA_CACHE_MAX:
+            _schema_cache.clear()
+    _schema_cache[key] = (now + _SCHEMA_CACHE_TTL, value)
+    return value
+
+
+def _invalidate_schema_cache(connection_id: Optional[str]) -> int:
+    """연결의 스키마 캐시 제거 후 제거된 항목 수 반환"""
+    keys = [key for key in _schema_cache if key[1] == connection_id]
+    for key in keys:
+        del _schema_cache[key]
+    return len(keys)
+
+
+def _table_response(table: TableInfo) -> TableResponse:
+    """핸들러가 만든 TableInfo를 검증 없이 응답 모델로 변환
+    
+    table_schema는 populate_by_name 없이 별칭("schema")으로만 채워지므로 별칭 키로 전달
+    """
+    return TableResponse.model_construct(
+        name=table.name,
+        schema=table.schema,
+        type=table.type,
+        row_count=table.row_count,
+        size=table.size,
+        comment=table.comment,
+        columns=table.columns
+    )
+
+
+def _schema_response(schema: SchemaInfo) -> SchemaResponse:
+    """핸들러가 만든 SchemaInfo를 검증 없이 응답 모델로 변환"""
+    return SchemaResponse.model_construct(
+        name=schema.name,
+        tables=[_table_response(table) for table in schema.tables],
+        views=[_table_response(view) for view in schema.views],
+        procedures=schema.procedures
+    )
+
+
+def _encode_with_etag(payload: Any) -> Tuple[bytes, str]:
+    """응답 본문 직렬화와 본문 해시 ETag 계산"""
+    body = orjson.dumps(jsonable_encoder(payload))
+    return body, f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_response(request: Request, payload: Any) -> Response:
+    """직렬화된 본문 해시로 ETag를 붙이고 If-None-Match가 일치하면 본문 없이 304 반환"""
+    return _encoded_response(request, *_encode_with_etag(payload))
+
+
+def _encoded_response(request: Request, body: bytes, etag: str) -> Response:
+    """이미 직렬화된 본문과 ETag로 응답 (If-None-Match가 일치하면 본문 없이 304)"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # 의존성
-def get_db_manager() -> ConnectionManager:
-    """ConnectionManager 의존성 주입 함수"""
-    try:
-        manager = get_connection_manager()
-        logger.debug("ConnectionManager 의존성 주입 성공")
-        return manager
-    except Exception as e:
-        logger.error(f"Failed to get connection manager: {e}")
-        raise HTTPException(status_code=500, detail=f"Database manager initialization failed: {e}")
+def get_db_manager(request: Request) -> ConnectionManager:
+    """ConnectionManager 의존성 주입 함수 (lifespan에서 초기화된 인스턴스, 없으면 전역 인스턴스)"""
+    manager = getattr(request.app.state, "db_manager", None)
+    return manager if manager is not None else get_connection_manager()
 
 
 # 연결 관련 엔드포인트
 @router.get("/supported", response_model=List[Dict[str, Any]])
-async def get_supported_database_types():
+async def get_supported_database_types(request: Request):
     """지원하는 데이터베이스 타입 목록"""
-    try:
-        return get_supported_databases()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _etag_response(request, get_supported_databases())
 
 
 @router.post("/connections/test")
@@ -129,49 +296,38 @@ async def test_database_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 연결 테스트"""
-    try:
-        # ConnectionManager 초기화 보장
-        await manager._ensure_initialized()
-        
-        # DatabaseType enum 변환
-        try:
-            db_type = DatabaseType(request.type)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Unsupported database type: {request.type}")
-        
-        # options 처리 - 스키마 정보 추가
-        options = request.options or {}
-        
-        # PostgreSQL의 경우 스키마 정보를 options에 저장
-        if db_type == DatabaseType.POSTGRESQL and request.schema:
-            options['schema'] = request.schema
-        
-        config = ConnectionConfig(
-            id="test",
-            name=request.name,
-            type=db_type,
-            host=request.host,
-            port=request.port,
-            database=request.database,
-            username=request.username,
-            password=request.password,
-            ssl=request.ssl,
-            connection_string=request.connection_string,
-            options=options
-        )
-        
-        success, message = await manager.test_config(config)
-        
-        return {
-            "success": success,
-            "message": message
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Connection test failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Connection test failed: {e}")
+    # DatabaseType enum 변환
+    db_type = _DB_TYPE_MAP.get(request.type)
+    if db_type is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported database type: {request.type}")
+    
+    # options 처리 - 스키마 정보 추가
+    options = request.options or {}
+    
+    # PostgreSQL의 경우 스키마 정보를 options에 저장
+    if db_type == DatabaseType.POSTGRESQL and request.schema:
+        options['schema'] = request.schema
+    
+    config = ConnectionConfig(
+        id="test",
+        name=request.name,
+        type=db_type,
+        host=request.host,
+        port=request.port,
+        database=request.database,
+        username=request.username,
+        password=request.password,
+        ssl=request.ssl,
+        connection_string=request.connection_string,
+        options=options
+    )
+    
+    success, message = await manager.test_config(config)
+    
+    return {
+        "success": success,
+        "message": message
+    }
 
 
 @router.post("/connections", response_model=Dict[str, Any])
@@ -180,68 +336,52 @@ async def create_database_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """새 데이터베이스 연결 생성"""
-    try:
-        # ConnectionManager 초기화 보장
-        await manager._ensure_initialized()
-        
-        # DatabaseType enum 변환
-        try:
-            db_type = DatabaseType(request.type)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Unsupported database type: {request.type}")
-        
-        # options 처리 - 스키마 정보 추가
-        options = request.options or {}
-        
-        # PostgreSQL의 경우 스키마 정보를 options에 저장
-        if db_type == DatabaseType.POSTGRESQL and hasattr(request, 'schema') and request.schema:
-            options['schema'] = request.schema
-        
-        config = ConnectionConfig(
-            id=request.id,  # 클라이언트에서 제공한 ID 사용
-            name=request.name,
-            type=db_type,
-            host=request.host,
-            port=request.port,
-            database=request.database,
-            username=request.username,
-            password=request.password,
-            ssl=request.ssl,
-            connection_string=request.connection_string,
-            options=options
-        )
-        
-        success, result = await manager.create_connection(config)
-        
-        if success:
-            return {
-                "success": True,
-                "connection_id": result,
-                "message": f"Connection '{request.name}' created successfully"
-            }
-        else:
-            raise HTTPException(status_code=400, detail=result)
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to create connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to create connection: {e}")
+    # DatabaseType enum 변환
+    db_type = _DB_TYPE_MAP.get(request.type)
+    if db_type is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported database type: {request.type}")
+    
+    # options 처리 - 스키마 정보 추가
+    options = request.options or {}
+    
+    # PostgreSQL의 경우 스키마 정보를 options에 저장
+    if db_type == DatabaseType.POSTGRESQL and hasattr(request, 'schema') and request.schema:
+        options['schema'] = request.schema
+    
+    config = ConnectionConfig(
+        id=request.id,  # 클라이언트에서 제공한 ID 사용
+        name=request.name,
+        type=db_type,
+        host=request.host,
+        port=request.port,
+        database=request.database,
+        username=request.username,
+        password=request.password,
+        ssl=request.ssl,
+        connection_string=request.connection_string,
+        options=options
+    )
+    
+    success, result = await manager.create_connection(config)
+    
+    if success:
+        _invalidate_schema_cache(result)
+        return {
+            "success": True,
+            "connection_id": result,
+            "message": f"Connection '{request.name}' created successfully"
+        }
+    else:
+        raise HTTPException(status_code=400, detail=result)
 
 
-@router.get("/connections", response_model=List[ConnectionResponse])
+@router.get("/connections", responses={200: {"model": List[ConnectionResponse]}})
 async def get_database_connections(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """모든 데이터베이스 연결 목록 조회"""
-    try:
-        # ConnectionManager 초기화 보장
-        await manager._ensure_initialized()
-        connections = manager.get_all_connections()
-        return [ConnectionResponse(**conn) for conn in connections]
-    except Exception as e:
-        logger.error(f"Failed to get connections: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get connections: {e}")
+    # get_connection_info() 딕셔너리가 ConnectionResponse와 동일한 형태이므로 그대로 반환
+    return manager.get_all_connections()
 
 
 @router.get("/connections/{connection_id}", response_model=ConnectionResponse)
@@ -250,20 +390,14 @@ async def get_database_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """특정 데이터베이스 연결 정보 조회"""
-    try:
-        handler = manager.get_connection(connection_id)
-        if not handler:
-            raise HTTPException(status_code=404, detail="Connection not found")
-        
-        info = handler.get_connection_info()
-        info['active'] = manager._active_connection_id == connection_id
-        
-        return ConnectionResponse(**info)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get connection info: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get connection info: {e}")
+    handler = manager.get_connection(connection_id)
+    if not handler:
+        raise HTTPException(status_code=404, detail="Connection not found")
+    
+    return ConnectionResponse(
+        **handler.get_connection_info(),
+        active=manager._active_connection_id == connection_id
+    )
 
 
 @router.put("/connections/{connection_id}/activate")
@@ -272,20 +406,11 @@ async def activate_database_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 연결을 활성 연결로 설정"""
-    try:
-        # ConnectionManager 초기화 보장
-        await manager._ensure_initialized()
-        
-        success = await manager.set_active_connection(connection_id)
-        if success:
-            return {"success": True, "message": "Connection activated"}
-        else:
-            raise HTTPException(status_code=404, detail="Connection not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to activate connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to activate connection: {e}")
+    success = await manager.set_active_connection(connection_id)
+    if success:
+        return {"success": True, "message": "Connection activated"}
+    else:
+        raise HTTPException(status_code=404, detail="Connection not found")
 
 
 @router.delete("/connections/{connection_id}")
@@ -294,17 +419,12 @@ async def delete_database_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 연결 삭제"""
-    try:
-        success = await manager.remove_connection(connection_id)
-        if success:
-            return {"success": True, "message": "Connection deleted"}
-        else:
-            raise HTTPException(status_code=404, detail="Connection not found")
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to delete connection: {e}")
+    success = await manager.remove_connection(connection_id)
+    _invalidate_schema_cache(connection_id)
+    if success:
+        return {"success": True, "message": "Connection deleted"}
+    else:
+        raise HTTPException(status_code=404, detail="Connection not found")
 
 
 @router.post("/connections/{connection_id}/test")
@@ -313,15 +433,11 @@ async def test_existing_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """기존 데이터베이스 연결 테스트"""
-    try:
-        success, message = await manager.test_connection(connection_id)
-        return {
-            "success": success,
-            "message": message
-        }
-    except Exception as e:
-        logger.error(f"Connection test failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Connection test failed: {e}")
+    success, message = await manager.test_connection(connection_id)
+    return {
+        "success": success,
+        "message": message
+    }
 
 
 @router.post("/connections/{connection_id}/refresh")
@@ -330,15 +446,12 @@ async def refresh_database_connection(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 연결 새로고침"""
-    try:
-        success = await manager.refresh_connection(connection_id)
-        if success:
-            return {"success": True, "message": "Connection refreshed"}
-        else:
-            raise HTTPException(status_code=404, detail="Connection not found")
-    except Exception as e:
-        logger.error(f"Failed to refresh connection: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to refresh connection: {e}")
+    success = await manager.refresh_connection(connection_id)
+    _invalidate_schema_cache(connection_id)
+    if success:
+        return {"success": True, "message": "Connection refreshed"}
+    else:
+        raise HTTPException(status_code=404, detail="Connection not found")
 
 
 # 쿼리 관련 엔드포인트
@@ -355,18 +468,18 @@ async def execute_database_query(
             request.params
         )
         
-        return QueryResponse(
-            success=result.success,
-            data=result.data,
-            columns=result.columns,
-            row_count=result.row_count,
-            execution_time=result.execution_time,
-            error=result.error,
-            metadata=result.metadata
-        )
+        if result.success and request.query.lstrip().upper().startswith(_DDL_PREFIXES):
+            _invalidate_schema_cache(request.connection_id or manager._active_connection_id)
+        
+        if request.stream and result.success:
+            # 전체 응답 본문을 한 번에 만들지 않고 행 배치 단위로 전송
+            return StreamingResponse(_ndjson_result(result), media_type="application/x-ndjson")
+        
+        # 행 데이터를 pydantic으로 다시 검증하지 않고 orjson으로 바로 직렬화
+        return Response(content=_query_result_body(result), media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Query execution failed: {e}")
+        logger.error("Query execution failed: %s", e)
         return QueryResponse(
             success=False,
             error=f"Query execution failed: {e}"
@@ -374,108 +487,70 @@ async def execute_database_query(
 
 
 # 스키마 관련 엔드포인트
-@router.get("/schema/tables", response_model=List[TableResponse])
+@router.get("/schema/tables", responses={200: {"model": List[TableResponse]}})
 async def get_database_tables(
     connection_id: Optional[str] = None,
     schema: Optional[str] = None,
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 테이블 목록 조회"""
-    try:
-        tables = await manager.get_tables(connection_id, schema)
-        return [
-            TableResponse(
-                name=table.name,
-                table_schema=table.schema,
-                type=table.type,
-                row_count=table.row_count,
-                size=table.size,
-                comment=table.comment,
-                columns=table.columns
-            )
-            for table in tables
-        ]
-    except ConnectionError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to get tables: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get tables: {e}")
+    resolved_id = connection_id or manager._active_connection_id
+    tables = await _cached_schema(
+        ("tables", resolved_id, schema, None),
+        lambda: manager.get_tables(connection_id, schema)
+    )
+    return [_table_response(table) for table in tables]
 
 
-@router.get("/schema", response_model=SchemaResponse)
+@router.get("/schema", responses={200: {"model": SchemaResponse}})
 async def get_database_schema(
+    request: Request,
     connection_id: Optional[str] = None,
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 스키마 정보 조회"""
-    try:
-        # ConnectionManager 초기화 보장
-        await manager._ensure_initialized()
-        
-        # 연결 확인
-        if connection_id:
-            connection = manager.get_connection(connection_id)
-            if not connection:
-                available_connections = manager.get_all_connections()
-                logger.warning(f"Connection {connection_id} not found. Available: {[c['id'] for c in available_connections]}")
-                raise HTTPException(
-                    status_code=404, 
-                    detail=f"Connection '{connection_id}' not found. Available connections: {len(available_connections)}"
+    # 연결 확인
+    if connection_id:
+        connection = manager.get_connection(connection_id)
+        if not connection:
+            available_connections = manager.get_all_connections()
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Connection %s not found. Available: %s",
+                    connection_id, [c['id'] for c in available_connections]
                 )
-        else:
-            # 활성 연결 확인
-            active_connection = manager.get_active_connection()
-            if not active_connection:
-                all_connections = manager.get_all_connections()
-                if not all_connections:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail="No database connections available. Please create and activate a connection first."
-                    )
-                else:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"No active connection. Please activate one of {len(all_connections)} available connections."
-                    )
-        
-        schema = await manager.get_schema(connection_id)
-        
-        return SchemaResponse(
-            name=schema.name,
-            tables=[
-                TableResponse(
-                    name=table.name,
-                    table_schema=table.schema,
-                    type=table.type,
-                    row_count=table.row_count,
-                    size=table.size,
-                    comment=table.comment,
-                    columns=table.columns
+            raise HTTPException(
+                status_code=404, 
+                detail=f"Connection '{connection_id}' not found. Available connections: {len(available_connections)}"
+            )
+    else:
+        # 활성 연결 확인
+        active_connection = manager.get_active_connection()
+        if not active_connection:
+            all_connections = manager.get_all_connections()
+            if not all_connections:
+                raise HTTPException(
+                    status_code=400, 
+                    detail="No database connections available. Please create and activate a connection first."
                 )
-                for table in schema.tables
-            ],
-            views=[
-                TableResponse(
-                    name=view.name,
-                    table_schema=view.schema,
-                    type=view.type,
-                    row_count=view.row_count,
-                    size=view.size,
-                    comment=view.comment,
-                    columns=view.columns
+            else:
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"No active connection. Please activate one of {len(all_connections)} available connections."
                 )
-                for view in schema.views
-            ],
-            procedures=schema.procedures
+    
+    resolved_id = connection_id or manager._active_connection_id
+    
+    async def load_encoded() -> Tuple[bytes, str]:
+        schema = await _cached_schema(
+            ("schema", resolved_id, None, None),
+            lambda: manager.get_schema(connection_id)
         )
-        
-    except HTTPException:
-        raise
-    except ConnectionError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to get schema: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get schema: {e}")
+        return _encode_with_etag(_schema_response(schema))
+    
+    # 직렬화된 본문과 ETag도 캐시 (캐시 적중 시 모델 순회 없이 If-None-Match 비교만 수행)
+    body, etag = await _cached_schema(("schema_body", resolved_id, None, None), load_encoded)
+    return _encoded_response(request, body, etag)
 
 
 @router.get("/schema/tables/{table_name}", response_model=TableResponse)
@@ -486,24 +561,41 @@ async def get_table_info(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """특정 테이블 정보 조회"""
-    try:
-        table = await manager.get_table_info(table_name, connection_id, schema)
-        
-        return TableResponse(
-            name=table.name,
-            table_schema=table.schema,
-            type=table.type,
-            row_count=table.row_count,
-            size=table.size,
-            comment=table.comment,
-            columns=table.columns
+    resolved_id = connection_id or manager._active_connection_id
+    table = await _cached_schema(
+        ("table", resolved_id, schema, table_name),
+        lambda: manager.get_table_info(table_name, connection_id, schema)
+    )
+    return _table_response(table)
+
+
+@router.get("/bootstrap")
+async def get_database_bootstrap(
+    connection_id: Optional[str] = None,
+    manager: ConnectionManager = Depends(get_db_manager)
+):
+    """초기 화면용 연결 목록, 스키마, 통계 일괄 조회 (연결이 없으면 schema는 null)"""
+    resolved_id = connection_id or manager._active_connection_id
+    schema = None
+    if resolved_id and manager.get_connection(resolved_id):
+        schema_info = await _cached_schema(
+            ("schema", resolved_id, None, None),
+            lambda: manager.get_schema(resolved_id)
         )
-        
-    except ConnectionError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to get table info: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get table info: {e}")
+        schema = _schema_response(schema_info)
+    
+    return {
+        "connections": manager.get_all_connections(),
+        "schema": schema,
+        "stats": manager.get_connection_stats()
+    }
+
+
+@router.post("/schema/invalidate/{connection_id}")
+async def invalidate_schema_cache(connection_id: str):
+    """연결의 스키마 캐시 수동 무효화"""
+    evicted = _invalidate_schema_cache(connection_id)
+    return {"success": True, "evicted": evicted}
 
 
 # 상태 및 통계 엔드포인트
@@ -512,16 +604,13 @@ async def get_database_status(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """데이터베이스 연결 상태 조회"""
-    try:
-        stats = manager.get_connection_stats()
-        return {
-            "status": "ok",
-            "stats": stats,
-            "timestamp": manager.get_connection_history(1)[0]["timestamp"] if manager.get_connection_history(1) else None
-        }
-    except Exception as e:
-        logger.error(f"Failed to get status: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get status: {e}")
+    stats = manager.get_connection_stats()
+    recent = manager.get_connection_history(1)
+    return {
+        "status": "ok",
+        "stats": stats,
+        "timestamp": recent[0]["timestamp"] if recent else None
+    }
 
 
 @router.get("/health")
@@ -529,17 +618,13 @@ async def check_connections_health(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """모든 연결 상태 확인"""
-    try:
-        health_status = await manager.check_all_connections()
-        return {
-            "healthy": all(health_status.values()),
-            "connections": health_status,
-            "total": len(health_status),
-            "healthy_count": sum(health_status.values())
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Health check failed: {e}")
+    health_status = await manager.check_all_connections()
+    return {
+        "healthy": all(health_status.values()),
+        "connections": health_status,
+        "total": len(health_status),
+        "healthy_count": sum(health_status.values())
+    }
 
 
 @router.get("/history")
@@ -548,12 +633,8 @@ async def get_connection_history(
     manager: ConnectionManager = Depends(get_db_manager)
 ):
     """연결 히스토리 조회"""
-    try:
-        history = manager.get_connection_history(limit)
-        return {
-            "history": history,
-            "count": len(history)
-        }
-    except Exception as e:
-        logger.error(f"Failed to get history: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get history: {e}") 
\ No newline at end of file
+    history = manager.get_connection_history(limit)
+    return {
+        "history": history,
+        "count": len(history)
+    }
@@ -4,7 +4,10 @@ Database Connection Manager - MindsDB inspired
 """
 
 import asyncio
+import time
 import uuid
+from collections import deque
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
 import logging
 from datetime import datetime
@@ -20,11 +23,20 @@ from .handlers.base_handler import (
     ConnectionError,
     DatabaseHandlerError
 )
-from .handlers.handler_factory import create_handler, validate_config
+from .handlers.handler_factory import create_handler, preload_handler, validate_config
 from .connection_storage import get_connection_storage
 
 logger = logging.getLogger(__name__)
 
+# 연결 변경 후 저장까지 대기 시간 (연속 변경을 한 번의 파일 쓰기로 합침)
+_SAVE_DEBOUNCE_SECONDS = 0.2
+
+# 연결 상태 확인 결과 재사용 시간
+_HEALTH_TTL_SECONDS = 5.0
+
+# 저장된 연결 사전 연결의 연결별 제한 시간 (응답 없는 호스트가 사전 연결을 붙잡지 않도록)
+_WARMUP_TIMEOUT_SECONDS = 10.0
+
 
 class ConnectionManager:
     """다중 데이터베이스 연결 관리자"""
@@ -32,17 +44,56 @@ class ConnectionManager:
     def __init__(self):
         self._connections: Dict[str, BaseDatabaseHandler] = {}
         self._active_connection_id: Optional[str] = None
-        self._connection_history: List[Dict] = []
+        # (timestamp, action, connection_id, connection_name) 튜플, 최대 1000개 (초과 시 오래된 항목부터 제거)
+        self._connection_history: deque = deque(maxlen=1000)
         self._lock = None  # 지연 생성
+        self._init_lock = asyncio.Lock()  # 초기 로드는 한 코루틴만 수행
+        self._conn_locks: Dict[str, list] = {}  # 연결 ID → [잠금, 사용/대기 중인 코루틴 수] (연결/해제 I/O 직렬화)
+        self._pending_ids: set = set()  # 연결 중인 ID 예약 (중복 생성 방지)
+        self._name_index: Dict[str, Dict[str, None]] = {}  # 연결 이름 → 생성 순서대로의 ID 집합 (같은 이름 허용)
+        self._health: Dict[str, tuple[float, bool]] = {}  # 연결 ID → (확인 시각, 정상 여부)
+        self._save_dirty = False  # 저장되지 않은 변경 여부
+        self._flush_task: Optional[asyncio.Task] = None
+        self._warmup_task: Optional[asyncio.Task] = None
         self._storage = get_connection_storage()
         self._initialized = False
     
     async def _ensure_initialized(self):
-        """지연 초기화 확인"""
-        if not self._initialized:
+        """지연 초기화 확인 (동시에 처음 호출돼도 저장된 연결은 한 번만 로드)"""
+        if self._initialized:
+            return
+        async with self._init_lock:
+            if self._initialized:
+                return
             self._lock = asyncio.Lock()
             await self._load_saved_connections()
             self._initialized = True
+            # 사전 연결은 백그라운드에서 수행 (연결되지 않는 호스트가 서버 시작과 다른 호출자를 막지 않도록)
+            if self._connections:
+                self._warmup_task = asyncio.create_task(self._warm_up_connections())
+    
+    async def initialize(self):
+        """저장된 연결 로드 (애플리케이션 시작 시 호출, 여러 번 호출해도 한 번만 수행)"""
+        await self._ensure_initialized()
+    
+    @asynccontextmanager
+    async def _connection_lock(self, connection_id: str):
+        """연결별 잠금 획득 (없으면 생성)
+        
+        잠금 항목은 해제 후 사용/대기 중인 코루틴이 없을 때만 제거하므로,
+        대기 중인 코루틴과 새 호출자가 서로 다른 잠금을 잡는 일이 없음
+        """
+        entry = self._conn_locks.get(connection_id)
+        if entry is None:
+            entry = self._conn_locks[connection_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and self._conn_locks.get(connection_id) is entry:
+                del self._conn_locks[connection_id]
     
     def _ensure_initialized_sync(self):
         """동기 메서드용 초기화 확인"""
@@ -53,67 +104,74 @@ class ConnectionManager:
                 self._lock = None  # 비동기에서 생성
     
     async def create_connection(self, config: ConnectionConfig) -> tuple[bool, str]:
-        """새 연결 생성"""
+        """새 연결 생성
+        
+        전역 잠금은 ID 예약에만 사용하고, 네트워크 I/O인 connect()와 저장은 잠금 밖에서 수행
+        """
         await self._ensure_initialized()
-        async with self._lock:
-            try:
-                # 설정 검증
-                is_valid, error_msg = validate_config(config)
-                if not is_valid:
-                    return False, error_msg
-                
-                # ID가 없거나 "test"면 새로 생성
-                if not config.id or config.id == "test":
-                    config.id = str(uuid.uuid4())
-                
-                # 이미 존재하는 연결인지 확인
-                if config.id in self._connections:
+        try:
+            # 핸들러 모듈 최초 임포트는 워커 스레드에서 (이후 검증/생성은 캐시 조회)
+            await preload_handler(config.type)
+            
+            # 설정 검증
+            is_valid, error_msg = validate_config(config)
+            if not is_valid:
+                return False, error_msg
+            
+            # ID가 없거나 "test"면 새로 생성
+            if not config.id or config.id == "test":
+                config.id = str(uuid.uuid4())
+            
+            # 1) 짧은 임계 구역: 중복 확인 후 ID 예약
+            async with self._lock:
+                if config.id in self._connections or config.id in self._pending_ids:
                     return False, f"Connection with ID {config.id} already exists"
-                
-                # 핸들러 생성
+                self._pending_ids.add(config.id)
+            
+            try:
+                # 2) 잠금 없이 핸들러 생성 및 연결 시도
                 handler = create_handler(config)
-                
-                # 연결 시도
                 connected = await handler.connect()
                 if not connected:
                     return False, f"Failed to connect: {handler.last_error}"
                 
-                # 연결 저장
+                # 3) 예약을 실제 핸들러로 교체 (await 없이 수행되므로 원자적)
                 self._connections[config.id] = handler
+                self._index_name(config.name, config.id)
                 
                 # 첫 번째 연결이면 활성 연결로 설정
                 if not self._active_connection_id:
                     self._active_connection_id = config.id
-                
-                # 히스토리 추가
-                self._add_to_history("created", config.id, config.name)
-                
-                # 영구 저장
-                await self._save_connections()
-                
-                logger.info(f"Created connection: {config.name} ({config.type.value})")
-                return True, config.id
-                
-            except Exception as e:
-                error_msg = f"Failed to create connection: {e}"
-                logger.error(error_msg)
-                return False, error_msg
+            finally:
+                self._pending_ids.discard(config.id)
+            
+            # 히스토리 추가
+            self._add_to_history("created", config.id, config.name)
+            
+            # 4) 영구 저장 예약 (잠금 밖, 짧은 시간 내 변경은 한 번의 쓰기로 합침)
+            self._mark_dirty()
+            
+            logger.info(f"Created connection: {config.name} ({config.type.value})")
+            return True, config.id
+            
+        except Exception as e:
+            error_msg = f"Failed to create connection: {e}"
+            logger.error(error_msg)
+            return False, error_msg
     
     async def remove_connection(self, connection_id: str) -> bool:
         """연결 제거"""
         await self._ensure_initialized()
-        async with self._lock:
+        # 다른 연결의 작업은 막지 않도록 해당 연결의 잠금만 사용
+        async with self._connection_lock(connection_id):
             try:
-                if connection_id not in self._connections:
+                handler = self._connections.get(connection_id)
+                if handler is None:
                     return False
                 
-                handler = self._connections[connection_id]
-                
-                # 연결 해제
-                await handler.disconnect()
-                
-                # 연결 제거
+                # 연결 제거 (딕셔너리 변경은 await 없이 수행되므로 원자적)
                 del self._connections[connection_id]
+                self._unindex_name(handler.config.name, connection_id)
                 
                 # 활성 연결이었다면 다른 연결로 변경
                 if self._active_connection_id == connection_id:
@@ -122,11 +180,14 @@ class ConnectionManager:
                     else:
                         self._active_connection_id = None
                 
+                # 연결 해제
+                await handler.disconnect()
+                
                 # 히스토리 추가
                 self._add_to_history("removed", connection_id, handler.config.name)
                 
-                # 영구 저장
-                await self._save_connections()
+                # 영구 저장 예약
+                self._mark_dirty()
                 
                 logger.info(f"Removed connection: {handler.config.name}")
                 return True
@@ -134,6 +195,8 @@ class ConnectionManager:
             except Exception as e:
                 logger.error(f"Failed to remove connection {connection_id}: {e}")
                 return False
+            finally:
+                self._health.pop(connection_id, None)
     
     async def test_connection(self, connection_id: str) -> tuple[bool, Optional[str]]:
         """연결 테스트"""
@@ -149,6 +212,9 @@ class ConnectionManager:
     async def test_config(self, config: ConnectionConfig) -> tuple[bool, Optional[str]]:
         """설정으로 연결 테스트 (실제 연결 생성 없이)"""
         try:
+            # 핸들러 모듈 최초 임포트는 워커 스레드에서 (이후 검증/생성은 캐시 조회)
+            await preload_handler(config.type)
+            
             # 설정 검증
             is_valid, error_msg = validate_config(config)
             if not is_valid:
@@ -186,13 +252,20 @@ class ConnectionManager:
             
         handler = self._connections[connection_id]
         
-        # 연결 상태 확인 및 필요시 재연결
-        if not handler.is_connected():
-            logger.info(f"Connection {connection_id} is not connected, attempting to reconnect...")
-            connected = await handler.connect()
-            if not connected:
-                logger.error(f"Failed to reconnect connection {connection_id}")
-                return False
+        # 최근 확인에서 정상이었고 여전히 연결 상태면 잠금 없이 바로 활성화
+        if not (self._is_recently_healthy(connection_id) and handler.is_connected()):
+            # 연결 상태 확인 및 필요시 재연결 (동시 재연결 방지)
+            async with self._connection_lock(connection_id):
+                # 잠금 대기 중 제거/교체된 연결이면 활성화하지 않음
+                if self._connections.get(connection_id) is not handler:
+                    return False
+                if not handler.is_connected():
+                    logger.info(f"Connection {connection_id} is not connected, attempting to reconnect...")
+                    connected = await handler.connect()
+                    self._health[connection_id] = (time.monotonic(), connected)
+                    if not connected:
+                        logger.error(f"Failed to reconnect connection {connection_id}")
+                        return False
         
         self._active_connection_id = connection_id
         self._add_to_history("activated", connection_id, handler.config.name)
@@ -202,20 +275,32 @@ class ConnectionManager:
     def get_all_connections(self) -> List[Dict[str, Any]]:
         """모든 연결 정보 조회"""
         self._ensure_initialized_sync()
-        connections = []
-        for connection_id, handler in self._connections.items():
-            info = handler.get_connection_info()
-            info['active'] = connection_id == self._active_connection_id
-            connections.append(info)
-        return connections
+        active_id = self._active_connection_id
+        # 핸들러의 캐시된 정보 딕셔너리는 공유되므로 복사본에 active 표시
+        return [
+            {**handler.get_connection_info(), 'active': connection_id == active_id}
+            for connection_id, handler in self._connections.items()
+        ]
     
     def get_connection_by_name(self, name: str) -> Optional[BaseDatabaseHandler]:
         """이름으로 연결 조회"""
-        for handler in self._connections.values():
-            if handler.config.name == name:
-                return handler
+        # 같은 이름이 여러 개면 가장 먼저 생성된 연결 반환
+        for connection_id in self._name_index.get(name, ()):
+            return self._connections.get(connection_id)
         return None
     
+    def _index_name(self, name: str, connection_id: str):
+        """이름 인덱스에 연결 추가"""
+        self._name_index.setdefault(name, {})[connection_id] = None
+    
+    def _unindex_name(self, name: str, connection_id: str):
+        """이름 인덱스에서 연결 제거 (같은 이름의 다른 연결은 유지)"""
+        ids = self._name_index.get(name)
+        if ids is not None:
+            ids.pop(connection_id, None)
+            if not ids:
+                del self._name_index[name]
+    
     async def execute_query(self, query: str, connection_id: Optional[str] = None, params: Optional[Dict] = None) -> QueryResult:
         """쿼리 실행"""
         await self._ensure_initialized()
@@ -284,9 +369,14 @@ class ConnectionManager:
             return False
         
         try:
-            # 재연결
-            await handler.disconnect()
-            connected = await handler.connect()
+            # 재연결 (같은 연결의 다른 연결/해제 작업과 직렬화)
+            async with self._connection_lock(connection_id):
+                # 잠금 대기 중 제거된 연결을 다시 연결하지 않음 (해제되지 않는 연결이 남음)
+                if self._connections.get(connection_id) is not handler:
+                    return False
+                await handler.disconnect()
+                connected = await handler.connect()
+                self._health[connection_id] = (time.monotonic(), connected)
             
             if connected:
                 self._add_to_history("refreshed", connection_id, handler.config.name)
@@ -297,26 +387,48 @@ class ConnectionManager:
             logger.error(f"Failed to refresh connection {connection_id}: {e}")
             return False
     
+    def _is_recently_healthy(self, connection_id: str) -> bool:
+        """TTL 내 마지막 상태 확인이 정상이었는지 여부"""
+        entry = self._health.get(connection_id)
+        return entry is not None and entry[1] and time.monotonic() - entry[0] < _HEALTH_TTL_SECONDS
+    
     async def check_all_connections(self) -> Dict[str, bool]:
-        """모든 연결 상태 확인"""
-        results = {}
+        """모든 연결 상태 확인 (/health용이므로 캐시를 쓰지 않고 항상 동시에 테스트, 결과로 캐시 갱신)"""
+        handlers = list(self._connections.items())
+        outcomes = await asyncio.gather(
+            *(handler.test_connection() for _, handler in handlers),
+            return_exceptions=True
+        )
         
-        for connection_id, handler in self._connections.items():
-            try:
-                is_connected, _ = await handler.test_connection()
-                results[connection_id] = is_connected
-            except Exception:
-                results[connection_id] = False
+        checked_at = time.monotonic()
+        results = {}
+        for (connection_id, _), outcome in zip(handlers, outcomes):
+            healthy = not isinstance(outcome, BaseException) and outcome[0]
+            results[connection_id] = healthy
+            self._health[connection_id] = (checked_at, healthy)
         
         return results
     
     async def disconnect_all(self) -> bool:
         """모든 연결 해제"""
+        # 진행 중인 사전 연결 중단 (해제 후 다시 연결되지 않도록)
+        task = self._warmup_task
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        
+        # 연결 목록을 비우기 전에 예약된 저장을 끝내야 빈 목록이 저장되지 않음
+        await self.flush_pending_saves()
         try:
-            for handler in self._connections.values():
-                await handler.disconnect()
+            # 연결별 해제를 동시에 수행 (개별 실패가 나머지 해제를 막지 않음)
+            await asyncio.gather(
+                *(handler.disconnect() for handler in self._connections.values()),
+                return_exceptions=True
+            )
             
             self._connections.clear()
+            self._name_index.clear()
+            self._health.clear()
             self._active_connection_id = None
             
             self._add_to_history("disconnected_all", "", "")
@@ -329,7 +441,16 @@ class ConnectionManager:
     
     def get_connection_history(self, limit: int = 50) -> List[Dict]:
         """연결 히스토리 조회"""
-        return self._connection_history[-limit:]
+        # 조회 시점에만 딕셔너리로 변환
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+                "action": action,
+                "connection_id": connection_id,
+                "connection_name": connection_name
+            }
+            for timestamp, action, connection_id, connection_name in list(self._connection_history)[-limit:]
+        ]
     
     def get_connection_stats(self) -> Dict[str, Any]:
         """연결 통계"""
@@ -349,27 +470,25 @@ class ConnectionManager:
     
     def _add_to_history(self, action: str, connection_id: str, connection_name: str):
         """히스토리 추가"""
-        self._connection_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "action": action,
-            "connection_id": connection_id,
-            "connection_name": connection_name
-        })
-        
-        # 히스토리 크기 제한 (최대 1000개)
-        if len(self._connection_history) > 1000:
-            self._connection_history = self._connection_history[-1000:]
+        self._connection_history.append((time.time(), action, connection_id, connection_name))
     
     async def _load_saved_connections(self):
         """저장된 연결 정보 로드"""
         try:
             saved_configs = await self._storage.load_connections()
             
-            for config_id, config in saved_configs.items():
+            # 핸들러 생성 (연결은 하지 않음) - 드라이버 모듈 최초 임포트 등이 이벤트 루프를 막지 않도록 스레드에서 병렬 수행
+            handlers = await asyncio.gather(
+                *(asyncio.to_thread(create_handler, config) for config in saved_configs.values()),
+                return_exceptions=True
+            )
+            
+            for (config_id, config), handler in zip(saved_configs.items(), handlers):
                 try:
-                    # 핸들러 생성 (연결은 하지 않음)
-                    handler = create_handler(config)
+                    if isinstance(handler, BaseException):
+                        raise handler
                     self._connections[config_id] = handler
+                    self._index_name(config.name, config_id)
                     
                     # 첫 번째 연결을 활성 연결로 설정
                     if not self._active_connection_id:
@@ -386,6 +505,55 @@ class ConnectionManager:
         except Exception as e:
             logger.error(f"Failed to load saved connections: {e}")
     
+    async def _warm_up_connections(self):
+        """저장된 연결을 미리 동시에 연결 (첫 쿼리의 연결 지연 제거)"""
+        handlers = list(self._connections.items())
+        if not handlers:
+            return
+        
+        # connect()는 실패 시 상태를 ERROR로 기록하므로 개별 실패는 다른 연결을 막지 않음
+        outcomes = await asyncio.gather(
+            *(self._warm_up_connection(connection_id, handler) for connection_id, handler in handlers),
+            return_exceptions=True
+        )
+        connected = sum(1 for outcome in outcomes if outcome is True)
+        logger.info(f"Warmed up {connected}/{len(handlers)} saved connections")
+    
+    async def _warm_up_connection(self, connection_id: str, handler: BaseDatabaseHandler) -> bool:
+        """저장된 연결 하나를 제한 시간 내에 연결 (같은 연결의 재연결/제거와 직렬화)"""
+        async with self._connection_lock(connection_id):
+            if self._connections.get(connection_id) is not handler:
+                return False
+            if handler.is_connected():
+                return True
+            try:
+                return await asyncio.wait_for(handler.connect(), _WARMUP_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning(f"Warm-up of connection {handler.config.name} timed out")
+                return False
+    
+    def _mark_dirty(self):
+        """변경 표시 후 지연 저장 예약 (이미 예약되어 있으면 합류)"""
+        self._save_dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+    
+    async def _delayed_flush(self):
+        """디바운스 후 저장 (저장 중 발생한 변경은 다음 반복에서 저장)"""
+        while self._save_dirty:
+            await asyncio.sleep(_SAVE_DEBOUNCE_SECONDS)
+            self._save_dirty = False
+            await self._save_connections()
+    
+    async def flush_pending_saves(self):
+        """예약된 저장 완료 대기 (종료 시 호출)"""
+        task = self._flush_task
+        if task is not None and not task.done():
+            await task
+        if self._save_dirty:
+            self._save_dirty = False
+            await self._save_connections()
+    
     async def _save_connections(self):
         """현재 연결 정보 저장"""
         try:
@@ -6,12 +6,15 @@ Connection Storage - 연결 정보 영구 저장
 import json
 import os
 import asyncio
-from typing import Dict, List, Optional, Any
+import shutil
+import threading
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 from datetime import datetime
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 import base64
+import orjson
 
 from .handlers.base_handler import ConnectionConfig, DatabaseType
 
@@ -26,18 +29,31 @@ class ConnectionStorage:
         self.connections_file = self.storage_dir / "connections.json"
         self.key_file = self.storage_dir / "encryption.key"
         
-        # 디렉토리 생성
-        self.storage_dir.mkdir(exist_ok=True)
-        
-        # 암호화 키 초기화
-        self._encryption_key = self._load_or_create_key()
-        self._cipher = Fernet(self._encryption_key)
+        # 디렉토리와 암호화 키는 처음 암호화/복호화할 때 준비 (워커 스레드에서 접근하므로 스레드 잠금 사용)
+        self._cipher_obj: Optional[Fernet] = None
+        self._cipher_lock = threading.Lock()
+        # 복호화하지 못한 연결 ID → 저장된 secrets 토큰 (다음 저장 때 그대로 기록해 자격 증명 유실 방지)
+        self._undecryptable: Dict[str, str] = {}
         
-        # 파일 lock
+        # 파일 lock (파일 교체와 읽기만 보호, 암호화/직렬화는 잠금 밖에서 수행)
         self._lock = asyncio.Lock()
+        self._save_seq = 0  # 마지막으로 요청된 저장 순번
+        self._written_seq = 0  # 마지막으로 파일에 기록된 저장 순번
+    
+    @property
+    def _cipher(self) -> Fernet:
+        """Fernet 인스턴스 (최초 접근 시 키 로드 또는 생성)"""
+        cipher = self._cipher_obj
+        if cipher is None:
+            with self._cipher_lock:
+                if self._cipher_obj is None:
+                    self._cipher_obj = Fernet(self._load_or_create_key())
+                cipher = self._cipher_obj
+        return cipher
     
     def _load_or_create_key(self) -> bytes:
         """암호화 키 로드 또는 생성"""
+        self.storage_dir.mkdir(exist_ok=True)
         if self.key_file.exists():
             with open(self.key_file, 'rb') as f:
                 return f.read()
@@ -48,114 +64,175 @@ class ConnectionStorage:
                 f.write(key)
             return key
     
-    def _encrypt_sensitive_data(self, data: str) -> str:
-        """민감한 데이터 암호화"""
-        if not data:
-            return data
-        try:
-            encrypted = self._cipher.encrypt(data.encode())
-            return base64.b64encode(encrypted).decode()
-        except Exception as e:
-            logger.error(f"Encryption failed: {e}")
-            return data
-    
     def _decrypt_sensitive_data(self, encrypted_data: str) -> str:
-        """민감한 데이터 복호화"""
+        """이전 형식의 개별 암호화 필드 복호화"""
         if not encrypted_data:
             return encrypted_data
         try:
-            decoded = base64.b64decode(encrypted_data.encode())
-            decrypted = self._cipher.decrypt(decoded)
+            try:
+                decrypted = self._cipher.decrypt(encrypted_data.encode())
+            except InvalidToken:
+                # 이전 형식: Fernet 토큰을 base64로 한 번 더 인코딩해 저장
+                decrypted = self._cipher.decrypt(base64.b64decode(encrypted_data.encode()))
             return decrypted.decode()
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             return encrypted_data
     
+    def _encrypt_secrets(self, config: ConnectionConfig) -> Optional[str]:
+        """비밀번호와 연결 문자열을 하나의 토큰으로 암호화 (연결당 Fernet 연산 1회)"""
+        if not config.password and not config.connection_string:
+            # 로드 시 복호화하지 못한 토큰은 빈 값으로 덮어쓰지 않고 보존
+            return self._undecryptable.get(config.id)
+        self._undecryptable.pop(config.id, None)
+        blob = orjson.dumps({"p": config.password, "cs": config.connection_string})
+        return self._cipher.encrypt(blob).decode()
+    
+    def _decrypt_secrets(self, conn_data: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """(password, connection_string) 복원 (secrets 필드가 없으면 이전 형식의 개별 필드를 복호화)"""
+        token = conn_data.get("secrets")
+        if token is None:
+            password = conn_data.get("password")
+            connection_string = conn_data.get("connection_string")
+            return (
+                self._decrypt_sensitive_data(password) if password else None,
+                self._decrypt_sensitive_data(connection_string) if connection_string else None
+            )
+        connection_id = conn_data.get("id")
+        try:
+            secrets = orjson.loads(self._cipher.decrypt(token.encode()))
+        except Exception as e:
+            # 키 불일치/토큰 손상: 저장된 토큰을 보존해 다음 저장 때 그대로 기록
+            logger.warning(f"Failed to decrypt secrets for connection {connection_id}, keeping stored token: {e!r}")
+            self._undecryptable[connection_id] = token
+            return None, None
+        self._undecryptable.pop(connection_id, None)
+        return secrets.get("p"), secrets.get("cs")
+    
     async def save_connections(self, connections: Dict[str, ConnectionConfig]) -> bool:
-        """연결 정보 저장"""
-        async with self._lock:
-            try:
-                connections_data = []
-                
-                for conn_id, config in connections.items():
-                    # 연결 설정을 dict로 변환
-                    conn_dict = {
-                        "id": config.id,
-                        "name": config.name,
-                        "type": config.type.value,
-                        "host": config.host,
-                        "port": config.port,
-                        "database": config.database,
-                        "username": config.username,
-                        # 민감한 데이터 암호화
-                        "password": self._encrypt_sensitive_data(config.password) if config.password else None,
-                        "connection_string": self._encrypt_sensitive_data(config.connection_string) if config.connection_string else None,
-                        "ssl": config.ssl,
-                        "options": config.options,
-                        "created_at": config.created_at.isoformat() if config.created_at else None,
-                        "updated_at": datetime.now().isoformat()
-                    }
-                    connections_data.append(conn_dict)
-                
-                # JSON 파일로 저장
-                with open(self.connections_file, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        "version": "1.0",
-                        "saved_at": datetime.now().isoformat(),
-                        "connections": connections_data
-                    }, f, indent=2, ensure_ascii=False)
-                
-                logger.info(f"Saved {len(connections)} connections to {self.connections_file}")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to save connections: {e}")
-                return False
+        """연결 정보 저장 (암호화와 파일 쓰기는 워커 스레드에서 수행)
+        
+        스냅샷에 순번을 매겨 직렬화는 잠금 없이 병렬로 수행하고, 파일 교체만 잠금 안에서 수행.
+        더 나중 스냅샷이 이미 기록되었다면 이전 스냅샷은 기록하지 않음
+        """
+        configs = list(connections.values())
+        self._save_seq += 1
+        seq = self._save_seq
+        try:
+            payload = await asyncio.to_thread(self._serialize_sync, configs)
+            
+            async with self._lock:
+                if seq < self._written_seq:
+                    return True
+                await asyncio.to_thread(self._write_sync, payload)
+                self._written_seq = seq
+            
+            logger.info(f"Saved {len(configs)} connections to {self.connections_file}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to save connections: {e}")
+            return False
+    
+    def _serialize_sync(self, configs: List[ConnectionConfig]) -> bytes:
+        """연결 설정 암호화 및 직렬화 (동기)"""
+        connections_data = []
+        now = datetime.now()
+        
+        for config in configs:
+            # 연결 설정을 dict로 변환
+            conn_dict = {
+                "id": config.id,
+                "name": config.name,
+                "type": config.type.value,
+                "host": config.host,
+                "port": config.port,
+                "database": config.database,
+                "username": config.username,
+                # 민감한 데이터 암호화 (password, connection_string을 하나의 토큰으로)
+                "secrets": self._encrypt_secrets(config),
+                "ssl": config.ssl,
+                "options": config.options,
+                # datetime은 orjson이 ISO 8601 문자열로 직렬화
+                "created_at": config.created_at,
+                "updated_at": now
+            }
+            connections_data.append(conn_dict)
+        
+        return orjson.dumps({
+            "version": "1.0",
+            "saved_at": now,
+            "connections": connections_data
+        }, option=orjson.OPT_INDENT_2)
+    
+    def _write_sync(self, payload: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체 (쓰기 도중 중단되어도 기존 파일 유지, 동기)"""
+        self.storage_dir.mkdir(exist_ok=True)
+        tmp_file = self.connections_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.connections_file)
     
     async def load_connections(self) -> Dict[str, ConnectionConfig]:
-        """연결 정보 로드"""
+        """연결 정보 로드 (파일 읽기와 복호화는 워커 스레드에서 수행)
+        
+        파일이 손상된 경우 빈 목록으로 덮어쓰지 않도록 별도 이름으로 보존한 뒤 예외를 전파
+        """
         async with self._lock:
+            if not self.connections_file.exists():
+                logger.info("No saved connections found")
+                return {}
+            
             try:
-                if not self.connections_file.exists():
-                    logger.info("No saved connections found")
-                    return {}
-                
-                with open(self.connections_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                connections = {}
+                connections = await asyncio.to_thread(self._load_sync)
+            except json.JSONDecodeError as e:
+                corrupt_file = self.connections_file.with_name(
+                    f"connections.corrupt_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                )
+                os.replace(self.connections_file, corrupt_file)
+                logger.error(f"Corrupted connections file moved to {corrupt_file}: {e}")
+                raise
+            
+            logger.info(f"Loaded {len(connections)} connections from {self.connections_file}")
+            return connections
+    
+    def _load_sync(self) -> Dict[str, ConnectionConfig]:
+        """파일 읽기 및 연결 설정 복원 (동기)"""
+        with open(self.connections_file, 'rb') as f:
+            data = orjson.loads(f.read())
+        
+        connections = {}
+        
+        for conn_data in data.get("connections", []):
+            try:
+                # 민감한 데이터 복호화
+                password, connection_string = self._decrypt_secrets(conn_data)
                 
-                for conn_data in data.get("connections", []):
-                    try:
-                        # ConnectionConfig 객체 재생성
-                        config = ConnectionConfig(
-                            id=conn_data["id"],
-                            name=conn_data["name"],
-                            type=DatabaseType(conn_data["type"]),
-                            host=conn_data.get("host"),
-                            port=conn_data.get("port"),
-                            database=conn_data.get("database"),
-                            username=conn_data.get("username"),
-                            # 민감한 데이터 복호화
-                            password=self._decrypt_sensitive_data(conn_data.get("password")) if conn_data.get("password") else None,
-                            connection_string=self._decrypt_sensitive_data(conn_data.get("connection_string")) if conn_data.get("connection_string") else None,
-                            ssl=conn_data.get("ssl", False),
-                            options=conn_data.get("options", {}),
-                            created_at=datetime.fromisoformat(conn_data["created_at"]) if conn_data.get("created_at") else datetime.now()
-                        )
-                        
-                        connections[config.id] = config
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to load connection {conn_data.get('name', 'unknown')}: {e}")
-                        continue
+                # ConnectionConfig 객체 재생성
+                config = ConnectionConfig(
+                    id=conn_data["id"],
+                    name=conn_data["name"],
+                    type=DatabaseType(conn_data["type"]),
+                    host=conn_data.get("host"),
+                    port=conn_data.get("port"),
+                    database=conn_data.get("database"),
+                    username=conn_data.get("username"),
+                    password=password,
+                    connection_string=connection_string,
+                    ssl=conn_data.get("ssl", False),
+                    options=conn_data.get("options", {}),
+                    created_at=datetime.fromisoformat(conn_data["created_at"]) if conn_data.get("created_at") else datetime.now()
+                )
                 
-                logger.info(f"Loaded {len(connections)} connections from {self.connections_file}")
-                return connections
+                connections[config.id] = config
                 
             except Exception as e:
-                logger.error(f"Failed to load connections: {e}")
-                return {}
+                logger.error(f"Failed to load connection {conn_data.get('name', 'unknown')}: {e}")
+                continue
+        
+        return connections
     
     async def delete_connection(self, connection_id: str) -> bool:
         """특정 연결 삭제"""
@@ -174,7 +251,6 @@ class ConnectionStorage:
         
         try:
             if self.connections_file.exists():
-                import shutil
                 shutil.copy2(self.connections_file, backup_file)
                 logger.info(f"Backup created: {backup_file}")
                 return str(backup_file)
@@ -21,6 +21,7 @@ from .handler_factory import (
     DatabaseHandlerFactory,
     HandlerRegistry,
     create_handler,
+    acreate_handler,
     get_supported_databases,
     is_database_supported,
     validate_config,
@@ -80,6 +81,7 @@ __all__ = [
     "DatabaseHandlerFactory",
     "HandlerRegistry",
     "create_handler",
+    "acreate_handler",
     "get_supported_databases",
     "is_database_supported", 
     "validate_config",
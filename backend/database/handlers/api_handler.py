@@ -4,10 +4,13 @@ API Handler Base - MindsDB inspired
 """
 
 import asyncio
+import re
 import time
-import json
+from collections import OrderedDict
+from functools import lru_cache, partial
 import aiohttp
-from typing import Dict, List, Any, Optional, Tuple
+import orjson
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from abc import abstractmethod
 import logging
 
@@ -26,6 +29,94 @@ from .base_handler import (
 
 logger = logging.getLogger(__name__)
 
+# 핸들러별 API 응답 캐시 최대 항목 수 (LRU)
+_RESPONSE_CACHE_SIZE = 256
+
+# 이 크기 이상의 응답은 워커 스레드에서 파싱 (이벤트 루프 블로킹 방지)
+_THREAD_PARSE_BYTES = 1 << 20
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 연결 시 사전 요청(HEAD)의 제한 시간 (느린 API가 connect()를 오래 붙잡지 않도록)
+_PREWARM_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# SELECT ... FROM table [WHERE ...] [LIMIT n] 한 번에 매칭 (테이블명은 "..." / `...` / [...] 인용 허용)
+_SELECT_RE = re.compile(
+    r"^\s*SELECT\s+.+?\s+FROM\s+"
+    r"(?:\"(?P<dquoted>[^\"]+)\"|`(?P<bquoted>[^`]+)`|\[(?P<squoted>[^\]]+)\]|(?P<table>\w+))"
+    r"(?:\s+WHERE\s+(?P<where>.+?))?"
+    r"(?:\s+LIMIT\s+(?P<limit>\d+))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+# key = 'value' | "value" | value 조건
+_COND_RE = re.compile(r"(\w+)\s*=\s*(?:'([^']*)'|\"([^\"]*)\"|([^\s'\"]+))")
+
+
+def _parse_conditions(where_clause: str) -> Tuple[Tuple[str, str], ...]:
+    """WHERE 절의 key = value 조건 목록"""
+    if not where_clause:
+        return ()
+    
+    # 가장 흔한 단일 조건은 정규식 없이 처리 (형태가 애매하면 아래 일반 경로로)
+    if where_clause.count("=") == 1:
+        key, _, value = where_clause.partition("=")
+        key = key.strip()
+        value = value.strip()
+        if key.isidentifier() and value:
+            quote = value[0]
+            if quote in "'\"":
+                if len(value) >= 2 and value[-1] == quote and quote not in value[1:-1]:
+                    return ((key, value[1:-1]),)
+            elif not any(ch.isspace() or ch in "'\"" for ch in value):
+                return ((key, value),)
+    
+    return tuple(
+        (key, single or double or bare)
+        for key, single, double, bare in _COND_RE.findall(where_clause)
+    )
+
+
+@lru_cache(maxsize=512)
+def _parse_select(query: str) -> Tuple[str, Tuple[Tuple[str, str], ...], Optional[int]]:
+    """SELECT 문을 (테이블명, 조건 목록, LIMIT)으로 파싱 (같은 쿼리 문자열은 캐시 재사용)
+    
+    대소문자 변환 없이 원본 문자열에서 그대로 추출하며, 테이블명 대소문자는 조회 시 무시
+    """
+    match = _SELECT_RE.match(query)
+    if match is None:
+        if query.lstrip()[:6].upper() != "SELECT":
+            raise QueryError("Only SELECT queries are supported for API calls")
+        raise QueryError("FROM clause is required")
+    
+    limit = match.group("limit")
+    table_name = (
+        match.group("table") or match.group("dquoted")
+        or match.group("bquoted") or match.group("squoted")
+    )
+    return (
+        table_name,
+        _parse_conditions(match.group("where")),
+        int(limit) if limit is not None else None
+    )
+
+
+def _build_extractor(data_path: str) -> Callable[[Any], Any]:
+    """점(.)으로 구분된 데이터 경로를 따라가는 함수 생성 (경로 분해는 테이블 정의 시 1회, 경로가 없으면 None 반환)"""
+    if not data_path:
+        return lambda response: response
+    
+    keys = tuple(data_path.split("."))
+    
+    def extract(response: Any) -> Any:
+        data = response
+        for key in keys:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+    
+    return extract
+
 
 class APIHandlerError(Exception):
     """API 핸들러 관련 에러"""
@@ -41,7 +132,8 @@ class APIEndpoint:
         method: str = "GET",
         description: str = "",
         parameters: Dict[str, Any] = None,
-        required_params: List[str] = None
+        required_params: List[str] = None,
+        cache_ttl: float = 60.0  # 응답 캐시 유효 시간(초), 0이면 캐시하지 않음
     ):
         self.name = name
         self.url = url
@@ -49,6 +141,7 @@ class APIEndpoint:
         self.description = description
         self.parameters = parameters or {}
         self.required_params = required_params or []
+        self.cache_ttl = cache_ttl
 
 
 class APITable:
@@ -64,8 +157,10 @@ class APITable:
         self.name = name
         self.endpoint = endpoint
         self.columns = columns or []
+        self.column_names = tuple(col["name"] for col in self.columns)  # 쿼리 결과용 컬럼명 (정의 시 1회 계산)
         self.data_path = data_path
         self.transform_func = transform_func
+        self.extract = _build_extractor(data_path)
 
 
 class BaseAPIHandler(BaseDatabaseHandler):
@@ -74,15 +169,32 @@ class BaseAPIHandler(BaseDatabaseHandler):
     외부 API를 데이터베이스처럼 취급
     """
     
+    # 커넥션 풀 기본 크기 (options의 pool_size/pool_size_per_host가 우선, 서브클래스에서 API별로 조정)
+    _DEFAULT_POOL_SIZE = 100
+    _DEFAULT_POOL_SIZE_PER_HOST = 20
+    
     def __init__(self, config: ConnectionConfig):
         super().__init__(config)
         self._session: Optional[aiohttp.ClientSession] = None
         self._endpoints: Dict[str, APIEndpoint] = {}
         self._tables: Dict[str, APITable] = {}
+        # 동시 HTTP 요청 수 상한 (기본값은 호스트별 커넥션 풀 크기)
+        self._inflight = asyncio.Semaphore(self._default_max_inflight())
+        # 테이블명 → (테이블 정의, 테이블명이 바인딩된 파라미터 변환 함수), 엔드포인트 초기화 후 구성
+        self._dispatch: Dict[str, Tuple[APITable, Callable[[Dict[str, Any]], Dict[str, Any]]]] = {}
         self._base_url = ""
         self._api_key = ""
         self._headers = {}
+        # (테이블명, 요청 파라미터) → (저장 시각, 추출된 데이터)
+        self._response_cache: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
         
+    def _default_max_inflight(self) -> int:
+        """동시 HTTP 요청 수 상한 (options의 max_inflight 우선)"""
+        options = self.config.options
+        return options.get(
+            "max_inflight", options.get("pool_size_per_host", self._DEFAULT_POOL_SIZE_PER_HOST)
+        )
+    
     @property
     def type(self) -> DatabaseType:
         return DatabaseType.EXTERNAL_API
@@ -116,16 +228,19 @@ class BaseAPIHandler(BaseDatabaseHandler):
             # API 설정 초기화
             self._initialize_api_config()
             
-            # 엔드포인트 초기화
+            # 엔드포인트 초기화 및 테이블별 호출 정보 구성
             self._initialize_endpoints()
+            self._dispatch = {
+                name: (table_def, partial(self._prepare_request_params, name))
+                for name, table_def in self._tables.items()
+            }
             
-            # HTTP 세션 생성
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(
-                headers=self._headers,
-                timeout=timeout
-            )
+            # HTTP 세션 생성 (test_connection에서 이미 만든 세션이 있으면 재사용)
+            self._ensure_session()
+            await self._prewarm_connection()
             
+            # connection 속성을 설정하여 is_connected()가 올바르게 작동하도록 함
+            self.connection = self._session
             self._set_status(ConnectionStatus.CONNECTED)
             self.logger.info(f"Connected to {self.api_name} API")
             return True
@@ -143,6 +258,8 @@ class BaseAPIHandler(BaseDatabaseHandler):
                 await self._session.close()
                 self._session = None
             
+            self._response_cache.clear()
+            self.connection = None
             self._set_status(ConnectionStatus.DISCONNECTED)
             self.logger.info(f"Disconnected from {self.api_name} API")
             return True
@@ -151,23 +268,56 @@ class BaseAPIHandler(BaseDatabaseHandler):
             self.logger.error(f"{self.api_name} API disconnect error: {e}")
             return False
     
+    async def _prewarm_connection(self):
+        """기본 URL에 HEAD 요청을 보내 DNS 조회와 TCP/TLS 연결을 커넥션 풀에 미리 준비 (실패는 무시)"""
+        if not self._base_url:
+            return
+        try:
+            async with self._session.head(self._base_url, timeout=_PREWARM_TIMEOUT) as response:
+                response.release()
+        except Exception as e:
+            self.logger.debug(f"{self.api_name} API prewarm skipped: {e}")
+    
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """HTTP 세션 반환 (없으면 API 설정을 초기화하고 생성, 세션은 disconnect()에서 닫힘)
+        
+        요청마다 세션을 만들지 않아야 keep-alive 연결과 커넥션 풀이 재사용됨
+        """
+        if self._session is None or self._session.closed:
+            self._initialize_api_config()
+            
+            # 커넥션 풀 크기는 options의 pool_size/pool_size_per_host로 조정, DNS 조회 결과는 5분 캐시
+            options = self.config.options
+            connector = aiohttp.TCPConnector(
+                limit=options.get('pool_size', self._DEFAULT_POOL_SIZE),
+                limit_per_host=options.get('pool_size_per_host', self._DEFAULT_POOL_SIZE_PER_HOST),
+                keepalive_timeout=30,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
     async def test_connection(self) -> Tuple[bool, Optional[str]]:
         """API 연결 테스트"""
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
+            session = self._ensure_session()
             
             # 테스트용 간단한 요청
             test_url = f"{self._base_url}/test" if hasattr(self, '_test_endpoint') else self._base_url
             
-            async with aiohttp.ClientSession(headers=self._headers) as session:
-                async with session.get(test_url) as response:
-                    if response.status < 400:
-                        latency = round((time.time() - start_time) * 1000, 2)
-                        message = f"Connected successfully (Status: {response.status}, Latency: {latency}ms)"
-                        return True, message
-                    else:
-                        return False, f"API returned status {response.status}"
-                        
+            async with session.get(test_url) as response:
+                if response.status < 400:
+                    latency = round((time.perf_counter() - start_time) * 1000, 2)
+                    message = f"Connected successfully (Status: {response.status}, Latency: {latency}ms)"
+                    return True, message
+                else:
+                    return False, f"API returned status {response.status}"
+                    
         except Exception as e:
             return False, self.format_error(e)
     
@@ -176,24 +326,26 @@ class BaseAPIHandler(BaseDatabaseHandler):
         if not self.is_connected():
             raise ConnectionError(f"Not connected to {self.api_name} API")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # 쿼리 파싱 (간단한 SELECT 문만 지원)
             parsed = self._parse_query(query)
-            table_name = parsed.get("table")
-            
-            if not table_name or table_name not in self._tables:
-                raise QueryError(f"Table '{table_name}' not found")
+            table_name = self._resolve_table_name(parsed.get("table"))
             
             # API 호출 실행
             data = await self._execute_api_call(table_name, parsed.get("where", {}), params)
             
+            # LIMIT 적용
+            limit = parsed.get("limit")
+            if limit is not None and isinstance(data, list):
+                data = data[:limit]
+            
             # 결과 변환
-            columns = [col["name"] for col in self._tables[table_name].columns]
+            columns = self._tables[table_name].column_names
             row_count = len(data) if isinstance(data, list) else 1
             
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self._log_query(query, execution_time, True)
             
             return QueryResult(
@@ -206,7 +358,7 @@ class BaseAPIHandler(BaseDatabaseHandler):
             )
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_msg = self.format_error(e)
             self._log_query(query, execution_time, False)
             
@@ -216,6 +368,24 @@ class BaseAPIHandler(BaseDatabaseHandler):
                 execution_time=execution_time
             )
     
+    async def execute_multiple_queries(self, queries: List[str]) -> List[QueryResult]:
+        """여러 쿼리를 동시에 실행 (API 조회는 서로 독립적이므로 순서 의존 없음)
+        
+        동시 요청 수는 options.max_concurrent_queries(기본 16)로 제한하며,
+        순차 실행과 같이 첫 실패 결과까지만 반환
+        """
+        semaphore = asyncio.Semaphore(self.config.options.get('max_concurrent_queries', 16))
+        
+        async def run(query: str) -> QueryResult:
+            async with semaphore:
+                return await self.execute_query(query)
+        
+        results = await asyncio.gather(*map(run, queries))
+        for index, result in enumerate(results):
+            if not result.success:
+                return results[:index + 1]
+        return results
+    
     async def get_tables(self, schema: Optional[str] = None) -> List[TableInfo]:
         """API 테이블 목록 조회 (엔드포인트 목록)"""
         try:
@@ -277,99 +447,107 @@ class BaseAPIHandler(BaseDatabaseHandler):
         if self._api_key:
             self._headers["Authorization"] = f"Bearer {self._api_key}"
     
+    def _resolve_table_name(self, table_name: Optional[str]) -> str:
+        """쿼리의 테이블명을 등록된 테이블명으로 변환 (대소문자 무시)"""
+        if table_name in self._tables:
+            return table_name
+        if table_name:
+            lowered = table_name.lower()
+            for name in self._tables:
+                if name.lower() == lowered:
+                    return name
+        raise QueryError(f"Table '{table_name}' not found")
+    
     def _parse_query(self, query: str) -> Dict[str, Any]:
-        """간단한 SQL 쿼리 파싱"""
-        # 매우 기본적인 SELECT 문 파싱
-        query = query.strip().upper()
-        
-        if not query.startswith("SELECT"):
-            raise QueryError("Only SELECT queries are supported for API calls")
-        
-        # FROM 절에서 테이블명 추출
-        from_idx = query.find("FROM")
-        if from_idx == -1:
-            raise QueryError("FROM clause is required")
-        
-        # 테이블명 추출 (간단한 파싱)
-        table_part = query[from_idx + 4:].strip()
-        where_idx = table_part.find("WHERE")
-        
-        if where_idx != -1:
-            table_name = table_part[:where_idx].strip()
-            where_clause = table_part[where_idx + 5:].strip()
-        else:
-            table_name = table_part.strip()
-            where_clause = ""
-        
+        """간단한 SQL 쿼리 파싱 (SELECT ... FROM table [WHERE ...] [LIMIT n])"""
+        table_name, where, limit = _parse_select(query)
         return {
-            "table": table_name.lower(),
-            "where": self._parse_where_clause(where_clause)
+            "table": table_name,
+            "where": dict(where),
+            "limit": limit
         }
     
     def _parse_where_clause(self, where_clause: str) -> Dict[str, Any]:
-        """WHERE 절 파싱 (매우 기본적)"""
-        if not where_clause:
-            return {}
-        
-        # 간단한 key=value 형태만 지원
-        conditions = {}
-        parts = where_clause.split("AND")
-        
-        for part in parts:
-            part = part.strip()
-            if "=" in part:
-                key, value = part.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip("'").strip('"')
-                conditions[key] = value
-        
-        return conditions
+        """WHERE 절 파싱 (key = value 조건만 지원, 키와 값의 대소문자 유지)"""
+        return dict(_parse_conditions(where_clause))
     
     async def _execute_api_call(self, table_name: str, where_params: Dict[str, Any], extra_params: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """실제 API 호출 실행"""
         if not self._session:
             raise APIHandlerError("API session not initialized")
         
-        table_def = self._tables[table_name]
+        table_def, prepare_params = self._dispatch[table_name]
         endpoint = table_def.endpoint
         
         # 요청 파라미터 준비
-        api_params = self._prepare_request_params(table_name, where_params)
+        api_params = prepare_params(where_params)
         if extra_params:
             api_params.update(extra_params)
         
+        # 같은 요청의 최근 응답은 캐시에서 반환 (파라미터는 요청 시 문자열로 전송되므로 문자열로 키 구성)
+        cache_key = (table_name, tuple(sorted((k, str(v)) for k, v in api_params.items())))
+        cached = self._response_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < endpoint.cache_ttl:
+            self._response_cache.move_to_end(cache_key)
+            return cached[1]
+        
         # API 호출
         try:
-            if endpoint.method == "GET":
-                async with self._session.get(endpoint.url, params=api_params) as response:
-                    response.raise_for_status()
-                    result = await response.json()
-            else:
-                async with self._session.post(endpoint.url, json=api_params) as response:
-                    response.raise_for_status()
-                    result = await response.json()
+            async with self._inflight:
+                result = await self._do_request(endpoint, api_params)
             
             # 데이터 추출 및 변환
             data = self._extract_data_from_response(result, table_def)
             
+            if endpoint.cache_ttl > 0:
+                self._response_cache[cache_key] = (time.monotonic(), data)
+                self._response_cache.move_to_end(cache_key)
+                if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            
             return data
             
+        except aiohttp.ClientResponseError as e:
+            # 5xx(서버 장애)만 만료된 캐시로 대체, 4xx(잘못된 파라미터, 키 만료 등)는 그대로 실패
+            if e.status >= 500 and cached is not None:
+                self.logger.warning(f"{self.api_name} API request failed, serving stale response: {e}")
+                return cached[1]
+            raise APIHandlerError(f"API request failed: {e}")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            # 연결 실패/시간 초과 시 만료된 캐시라도 있으면 반환
+            if cached is not None:
+                self.logger.warning(f"{self.api_name} API request failed, serving stale response: {e}")
+                return cached[1]
+            raise APIHandlerError(f"API request failed: {e}")
         except aiohttp.ClientError as e:
             raise APIHandlerError(f"API request failed: {e}")
         except Exception as e:
             raise APIHandlerError(f"API call error: {e}")
     
+    async def _do_request(self, endpoint: APIEndpoint, api_params: Dict[str, Any]) -> Any:
+        """엔드포인트 요청 후 JSON 응답 파싱 (요청/응답 JSON은 orjson으로 직렬화/파싱)
+        
+        GET은 쿼리 문자열, 그 외 메서드는 JSON 본문으로 파라미터 전달
+        """
+        if endpoint.method == "GET":
+            request_kwargs = {"params": api_params}
+        else:
+            request_kwargs = {"data": orjson.dumps(api_params), "headers": _JSON_HEADERS}
+        
+        async with self._session.request(endpoint.method, endpoint.url, **request_kwargs) as response:
+            response.raise_for_status()
+            raw = await response.read()
+        
+        if len(raw) >= _THREAD_PARSE_BYTES:
+            return await asyncio.to_thread(orjson.loads, raw)
+        return orjson.loads(raw)
+    
     def _extract_data_from_response(self, response: Dict[str, Any], table_def: APITable) -> List[Dict[str, Any]]:
         """API 응답에서 데이터 추출"""
-        data = response
-        
         # 데이터 경로 탐색
-        if table_def.data_path:
-            for key in table_def.data_path.split("."):
-                if key in data:
-                    data = data[key]
-                else:
-                    return []
+        data = table_def.extract(response)
+        if data is None:
+            return []
         
         # 변환 함수 적용
         if table_def.transform_func:
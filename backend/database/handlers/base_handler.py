@@ -35,7 +35,7 @@ class ConnectionStatus(Enum):
     CONNECTING = "connecting"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionConfig:
     """연결 설정"""
     id: str
@@ -58,9 +58,9 @@ class ConnectionConfig:
             self.created_at = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryResult:
-    """쿼리 결과"""
+    """쿼리 결과 (반환 후 변경하지 않는 값 객체)"""
     success: bool
     data: Optional[List[Dict[str, Any]]] = None
     columns: Optional[List[str]] = None
@@ -71,10 +71,10 @@ class QueryResult:
     
     def __post_init__(self):
         if self.metadata is None:
-            self.metadata = {}
+            object.__setattr__(self, "metadata", {})
 
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """테이블 정보"""
     name: str
@@ -90,7 +90,7 @@ class TableInfo:
             self.columns = []
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaInfo:
     """스키마 정보"""
     name: str
@@ -107,6 +107,10 @@ class SchemaInfo:
             self.procedures = []
 
 
+# is_connected()에서 동일성 비교용
+_CONNECTED = ConnectionStatus.CONNECTED
+
+
 class BaseDatabaseHandler(ABC):
     """
     MindsDB 스타일 베이스 데이터베이스 핸들러
@@ -119,6 +123,8 @@ class BaseDatabaseHandler(ABC):
         self.status = ConnectionStatus.DISCONNECTED
         self.last_error = None
         self.connected_at = None
+        self._type_value = config.type.value  # get_connection_info용 (설정 타입은 불변)
+        self._info_cache: Optional[Dict[str, Any]] = None  # get_connection_info() 결과 (상태 변경 시 무효화)
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
         
     @property
@@ -172,14 +178,16 @@ class BaseDatabaseHandler(ABC):
     
     def is_connected(self) -> bool:
         """연결 상태 확인"""
-        return self.status == ConnectionStatus.CONNECTED and self.connection is not None
+        return self.status is _CONNECTED and self.connection is not None
     
     def get_connection_info(self) -> Dict[str, Any]:
-        """연결 정보 반환"""
-        return {
+        """연결 정보 반환 (상태가 바뀔 때까지 같은 딕셔너리를 재사용하므로 호출자는 수정하지 말 것)"""
+        if self._info_cache is not None:
+            return self._info_cache
+        self._info_cache = {
             "id": self.config.id,
             "name": self.config.name,
-            "type": self.config.type.value,
+            "type": self._type_value,
             "status": self.status.value,
             "host": self.config.host,
             "port": self.config.port,
@@ -187,11 +195,13 @@ class BaseDatabaseHandler(ABC):
             "connected_at": self.connected_at.isoformat() if self.connected_at else None,
             "last_error": self.last_error
         }
+        return self._info_cache
     
     def _set_status(self, status: ConnectionStatus, error: Optional[str] = None):
         """상태 설정"""
         self.status = status
         self.last_error = error
+        self._info_cache = None
         
         if status == ConnectionStatus.CONNECTED:
             self.connected_at = datetime.now()
@@ -199,12 +209,10 @@ class BaseDatabaseHandler(ABC):
             self.connected_at = None
     
     def _log_query(self, query: str, execution_time: float, success: bool):
-        """쿼리 로깅"""
-        log_msg = f"Query executed in {execution_time:.3f}s: {query[:100]}..."
-        if success:
-            self.logger.info(log_msg)
-        else:
-            self.logger.error(log_msg)
+        """쿼리 로깅 (해당 레벨이 꺼져 있으면 메시지를 만들지 않음)"""
+        level = logging.INFO if success else logging.ERROR
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, "Query executed in %.3fs: %s...", execution_time, query[:100])
     
     async def execute_multiple_queries(self, queries: List[str]) -> List[QueryResult]:
         """여러 쿼리 실행"""
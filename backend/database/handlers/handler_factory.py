@@ -4,6 +4,7 @@ Database Handler Factory - MindsDB inspired
 """
 
 from typing import Dict, Type, Optional, List
+import asyncio
 import importlib
 import logging
 
@@ -20,8 +21,14 @@ logger = logging.getLogger(__name__)
 class HandlerRegistry:
     """핸들러 레지스트리 - MindsDB 스타일"""
     
+    __slots__ = ("_handlers", "_unavailable", "_snapshot", "_handler_modules", "_handler_classes")
+    
     def __init__(self):
         self._handlers: Dict[DatabaseType, Type[BaseDatabaseHandler]] = {}
+        # 로딩에 실패한 타입 → 에러 메시지 (실패한 임포트를 매번 다시 시도하지 않음)
+        self._unavailable: Dict[DatabaseType, str] = {}
+        # 전체 타입의 핸들러 정보 스냅샷 (최초 조회 시 생성, 등록 시 무효화)
+        self._snapshot: Optional[List[Dict]] = None
         self._handler_modules: Dict[DatabaseType, str] = {
             DatabaseType.MYSQL: 'backend.database.handlers.mysql_handler',
             DatabaseType.POSTGRESQL: 'backend.database.handlers.postgresql_handler', 
@@ -50,12 +57,19 @@ class HandlerRegistry:
     def register_handler(self, db_type: DatabaseType, handler_class: Type[BaseDatabaseHandler]):
         """핸들러 등록"""
         self._handlers[db_type] = handler_class
+        self._unavailable.pop(db_type, None)
+        self._snapshot = None
         logger.info(f"Registered handler for {db_type.value}: {handler_class.__name__}")
     
     def get_handler_class(self, db_type: DatabaseType) -> Type[BaseDatabaseHandler]:
         """핸들러 클래스 조회 (지연 로딩)"""
-        if db_type in self._handlers:
-            return self._handlers[db_type]
+        handler_class = self._handlers.get(db_type)
+        if handler_class is not None:
+            return handler_class
+        
+        error_msg = self._unavailable.get(db_type)
+        if error_msg is not None:
+            raise DatabaseHandlerError(error_msg)
         
         # 지연 로딩
         if db_type in self._handler_modules:
@@ -73,13 +87,25 @@ class HandlerRegistry:
                 
             except ImportError as e:
                 logger.warning(f"Failed to import handler for {db_type.value}: {e}")
-                raise DatabaseHandlerError(f"Handler for {db_type.value} not available: {e}")
+                error_msg = f"Handler for {db_type.value} not available: {e}"
             except AttributeError as e:
                 logger.error(f"Handler class {class_name} not found in {module_name}: {e}")
-                raise DatabaseHandlerError(f"Handler class for {db_type.value} not found: {e}")
+                error_msg = f"Handler class for {db_type.value} not found: {e}"
+            
+            self._unavailable[db_type] = error_msg
+            raise DatabaseHandlerError(error_msg)
         
         raise DatabaseHandlerError(f"No handler registered for {db_type.value}")
     
+    async def aget_handler_class(self, db_type: DatabaseType) -> Type[BaseDatabaseHandler]:
+        """핸들러 클래스 조회 (비동기, 최초 모듈 임포트는 워커 스레드에서 수행해 이벤트 루프를 막지 않음)"""
+        handler_class = self._handlers.get(db_type)
+        if handler_class is not None:
+            return handler_class
+        if db_type in self._unavailable:
+            return self.get_handler_class(db_type)  # 기록된 에러를 그대로 발생
+        return await asyncio.to_thread(self.get_handler_class, db_type)
+    
     def is_handler_available(self, db_type: DatabaseType) -> bool:
         """핸들러 사용 가능 여부 확인"""
         try:
@@ -90,11 +116,14 @@ class HandlerRegistry:
     
     def get_available_handlers(self) -> List[DatabaseType]:
         """사용 가능한 핸들러 목록"""
-        available = []
-        for db_type in DatabaseType:
-            if self.is_handler_available(db_type):
-                available.append(db_type)
-        return available
+        return [DatabaseType(info["type"]) for info in self.get_all_handler_info() if info["available"]]
+    
+    def get_all_handler_info(self) -> List[Dict]:
+        """전체 타입의 핸들러 정보 (스냅샷 재사용, 호출자는 수정하지 말 것)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = [self.get_handler_info(db_type) for db_type in DatabaseType]
+        return snapshot
     
     def get_handler_info(self, db_type: DatabaseType) -> Optional[Dict]:
         """핸들러 정보 조회"""
@@ -119,6 +148,24 @@ class HandlerRegistry:
 # 글로벌 레지스트리 인스턴스
 _registry = HandlerRegistry()
 
+_SERVER_REQUIRED_FIELDS = (
+    ("host", "Host is required"),
+    ("username", "Username is required"),
+    ("database", "Database name is required"),
+)
+
+# 데이터베이스 타입별 필수 필드 (필드명, 오류 메시지)
+_REQUIRED_FIELDS: Dict[DatabaseType, tuple] = {
+    DatabaseType.MYSQL: _SERVER_REQUIRED_FIELDS,
+    DatabaseType.POSTGRESQL: _SERVER_REQUIRED_FIELDS,
+    DatabaseType.ORACLE: _SERVER_REQUIRED_FIELDS,
+    DatabaseType.MSSQL: _SERVER_REQUIRED_FIELDS,
+    DatabaseType.SQLITE: (("database", "Database file path is required"),),
+    DatabaseType.REDIS: (("host", "Host is required"),),
+    DatabaseType.KOSIS_API: (("password", "KOSIS API key is required"),),  # API 키를 password 필드에 저장
+    DatabaseType.EXTERNAL_API: (("host", "API base URL is required"),),
+}
+
 
 class DatabaseHandlerFactory:
     """데이터베이스 핸들러 팩토리"""
@@ -137,15 +184,16 @@ class DatabaseHandlerFactory:
             logger.error(f"Failed to create handler for {config.type.value}: {e}")
             raise DatabaseHandlerError(f"Failed to create {config.type.value} handler: {e}")
     
+    @staticmethod
+    async def acreate_handler(config: ConnectionConfig) -> BaseDatabaseHandler:
+        """설정에 따른 핸들러 생성 (비동기 컨텍스트용, 핸들러 모듈 최초 임포트를 워커 스레드에서 수행)"""
+        await preload_handler(config.type)
+        return DatabaseHandlerFactory.create_handler(config)
+    
     @staticmethod
     def get_supported_databases() -> List[Dict]:
         """지원하는 데이터베이스 목록"""
-        databases = []
-        for db_type in DatabaseType:
-            info = _registry.get_handler_info(db_type)
-            if info:
-                databases.append(info)
-        return databases
+        return list(_registry.get_all_handler_info())
     
     @staticmethod
     def is_database_supported(db_type: DatabaseType) -> bool:
@@ -167,35 +215,15 @@ class DatabaseHandlerFactory:
             if not _registry.is_handler_available(config.type):
                 return False, f"Handler for {config.type.value} is not available"
             
-            # 데이터베이스별 필수 필드 검사
-            if config.type in [DatabaseType.MYSQL, DatabaseType.POSTGRESQL, DatabaseType.ORACLE, DatabaseType.MSSQL]:
-                if not config.host:
-                    return False, "Host is required"
-                if not config.username:
-                    return False, "Username is required"
-                if not config.database:
-                    return False, "Database name is required"
+            # 데이터베이스별 필수 필드 검사 (타입별 검사 목록을 한 번의 조회로 선택)
+            for field_name, error_msg in _REQUIRED_FIELDS.get(config.type, ()):
+                if not getattr(config, field_name):
+                    return False, error_msg
             
-            elif config.type == DatabaseType.MONGODB:
+            if config.type == DatabaseType.MONGODB:
                 if not config.connection_string and not config.host:
                     return False, "Connection string or host is required"
             
-            elif config.type == DatabaseType.SQLITE:
-                if not config.database:
-                    return False, "Database file path is required"
-            
-            elif config.type == DatabaseType.REDIS:
-                if not config.host:
-                    return False, "Host is required"
-            
-            elif config.type == DatabaseType.KOSIS_API:
-                if not config.password:  # API 키를 password 필드에 저장
-                    return False, "KOSIS API key is required"
-            
-            elif config.type == DatabaseType.EXTERNAL_API:
-                if not config.host:
-                    return False, "API base URL is required"
-            
             return True, None
             
         except Exception as e:
@@ -208,6 +236,19 @@ def create_handler(config: ConnectionConfig) -> BaseDatabaseHandler:
     return DatabaseHandlerFactory.create_handler(config)
 
 
+async def acreate_handler(config: ConnectionConfig) -> BaseDatabaseHandler:
+    """비동기 핸들러 생성 편의 함수"""
+    return await DatabaseHandlerFactory.acreate_handler(config)
+
+
+async def preload_handler(db_type: DatabaseType) -> None:
+    """핸들러 클래스 미리 로드 (실패는 이후 검증/생성 단계에서 동일하게 보고되므로 무시)"""
+    try:
+        await _registry.aget_handler_class(db_type)
+    except DatabaseHandlerError:
+        pass
+
+
 def get_supported_databases() -> List[Dict]:
     """지원 데이터베이스 목록 조회 편의 함수"""
     return DatabaseHandlerFactory.get_supported_databases()
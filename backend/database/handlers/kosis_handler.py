@@ -3,22 +3,154 @@ KOSIS API Handler - MindsDB inspired
 한국 통계청(KOSIS) API를 데이터베이스처럼 취급하는 핸들러
 """
 
+import asyncio
 import os
 import time
-import json
 import aiohttp
-from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime
+import orjson
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Tuple, Mapping
+from datetime import datetime, timezone
 
-from .api_handler import BaseAPIHandler, APIEndpoint, APITable
-from .base_handler import DatabaseType, ConnectionConfig
+from .api_handler import BaseAPIHandler, APIEndpoint, APITable, APIHandlerError
+from .base_handler import DatabaseType, ConnectionConfig, ConnectionError
+
+
+def _parse_number(value: Any) -> Any:
+    """KOSIS 수치 문자열을 int/float로 변환 (변환 불가 시 원본 유지)"""
+    if not isinstance(value, str):
+        return value
+    try:
+        return float(value) if '.' in value else int(value)
+    except ValueError:
+        return value
+
+
+# 수치로 변환하는 KOSIS 응답 컬럼
+_NUMERIC_COLS = frozenset({"DT"})
+
+# 쿼터 초과/과부하로 간주하는 응답 코드 (동시성 감소 대상)
+_THROTTLE_STATUSES = frozenset({429, 502, 503})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class KOSISRateLimiter:
+    """KOSIS 요청 속도 제어
+    
+    - AIMD: 429/502/503 또는 Retry-After 응답 시 동시성을 beta배로 줄이고,
+      목표 지연 시간 이내의 성공 응답마다 alpha씩 늘림 (max_concurrency 이하)
+    - Retry-After 기간 동안 새 요청 대기, rpm_limit 설정 시 최근 60초 요청 수 제한
+    """
+    
+    def __init__(self, max_concurrency: int, rpm_limit: int = 0, alpha: float = 0.5,
+                 beta: float = 0.5, latency_target: float = 1.0):
+        self.max_concurrency = max_concurrency
+        self.concurrency = float(max_concurrency)
+        self.rpm_limit = rpm_limit
+        self.alpha = alpha
+        self.beta = beta
+        self.latency_target = latency_target
+        self._active = 0
+        self._slots = asyncio.Condition()
+        self._rpm_window: deque = deque()
+        self._blocked_until = 0.0
+    
+    async def acquire(self):
+        """현재 동시성 한도 내의 슬롯 확보 후 쓰로틀링 대기"""
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._active < int(self.concurrency))
+            self._active += 1
+        try:
+            await self.wait_if_throttled()
+        except BaseException:
+            await self._release_slot()
+            raise
+    
+    async def release(self, status: Optional[int], headers: Optional[Mapping[str, str]], latency: float):
+        """응답 결과로 동시성 조정 후 슬롯 반환 (status가 None이면 조정하지 않음)"""
+        self.record(status, headers, latency)
+        await self._release_slot()
+    
+    async def _release_slot(self):
+        async with self._slots:
+            self._active -= 1
+            # 동시성이 늘어난 경우 늘어난 만큼 대기 중인 요청을 깨움
+            self._slots.notify(max(1, int(self.concurrency) - self._active))
+    
+    async def wait_if_throttled(self):
+        """Retry-After 차단 기간과 분당 요청 수 한도를 넘지 않을 때까지 대기"""
+        while True:
+            now = time.monotonic()
+            delay = self._blocked_until - now
+            if self.rpm_limit:
+                window = self._rpm_window
+                while window and now - window[0] >= 60.0:
+                    window.popleft()
+                if len(window) >= self.rpm_limit:
+                    delay = max(delay, 60.0 - (now - window[0]))
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        if self.rpm_limit:
+            self._rpm_window.append(now)
+    
+    def record(self, status: Optional[int], headers: Optional[Mapping[str, str]], latency: float):
+        """응답 상태/헤더/지연 시간으로 동시성 갱신"""
+        if status is None:
+            return
+        retry_after = _parse_retry_after(headers.get("Retry-After")) if headers else None
+        if retry_after is not None:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        
+        if status in _THROTTLE_STATUSES or retry_after is not None:
+            self.concurrency = max(1.0, self.concurrency * self.beta)
+        elif status < 400 and latency <= self.latency_target:
+            self.concurrency = min(float(self.max_concurrency), self.concurrency + self.alpha)
 
 
 class KOSISHandler(BaseAPIHandler):
     """KOSIS API 핸들러"""
     
+    # KOSIS는 과도한 동시 요청에 429/연결 리셋으로 응답하므로 풀을 작게 유지
+    _DEFAULT_POOL_SIZE = 64
+    _DEFAULT_POOL_SIZE_PER_HOST = 16
+    
+    # 테이블별로 WHERE 조건에서 API 요청 파라미터로 전달하는 키
+    _PARAM_KEYS: Dict[str, Tuple[str, ...]] = {
+        "statistics_data": ("userStatsId", "orgId", "tblId", "startPrdDe", "endPrdDe", "prdSe"),
+        "statistics_list": ("orgId", "tblId"),
+        "statistics_search": ("searchNm",),
+        "statistics_detail": ("orgId", "tblId"),
+    }
+    
     def __init__(self, config: ConnectionConfig):
         super().__init__(config)
+        # 쿼터 초과 응답에 맞춰 동시성을 조절 (분당 요청 수 상한은 options.rpm_limit 또는 KOSIS_RPM_LIMIT, 0이면 무제한)
+        self._rate_limiter = KOSISRateLimiter(
+            self._default_max_inflight(),
+            rpm_limit=int(config.options.get("rpm_limit", os.getenv("KOSIS_RPM_LIMIT", "0")))
+        )
+    
+    def _default_max_inflight(self) -> int:
+        """동시 요청 상한 (options의 max_inflight > KOSIS_MAX_CONCURRENCY 환경변수 > 16)"""
+        options = self.config.options
+        if "max_inflight" in options:
+            return options["max_inflight"]
+        return int(os.getenv("KOSIS_MAX_CONCURRENCY", str(self._DEFAULT_POOL_SIZE_PER_HOST)))
         
     @property
     def type(self) -> DatabaseType:
@@ -46,12 +178,15 @@ class KOSISHandler(BaseAPIHandler):
     def _initialize_endpoints(self):
         """KOSIS API 엔드포인트 및 테이블 정의"""
         
+        # 응답 캐시 유효 시간은 데이터 변경 주기에 맞춤 (설명 1시간, 목록 10분, 검색 2분, 데이터 1분)
+        
         # 1. 통계 데이터 조회 엔드포인트
         stats_data_endpoint = APIEndpoint(
             name="statistics_data",
             url=f"{self._base_url}/statisticsParameterData.do",
             method="GET",
             description="통계 데이터 조회",
+            cache_ttl=60.0,
             parameters={
                 "method": "getList",
                 "apiKey": self._api_key,
@@ -93,6 +228,7 @@ class KOSISHandler(BaseAPIHandler):
             url=f"{self._base_url}/statisticsList.do",
             method="GET",
             description="통계 목록 조회",
+            cache_ttl=600.0,
             parameters={
                 "method": "getList",
                 "apiKey": self._api_key,
@@ -130,6 +266,7 @@ class KOSISHandler(BaseAPIHandler):
             url=f"{self._base_url}/statisticsSearch.do",
             method="GET", 
             description="통계 검색",
+            cache_ttl=120.0,
             parameters={
                 "method": "getList",
                 "apiKey": self._api_key,
@@ -163,6 +300,7 @@ class KOSISHandler(BaseAPIHandler):
             url=f"{self._base_url}/statisticsDetail.do",
             method="GET",
             description="통계 설명 조회",
+            cache_ttl=3600.0,
             parameters={
                 "method": "getMeta",
                 "apiKey": self._api_key,
@@ -194,83 +332,55 @@ class KOSISHandler(BaseAPIHandler):
         )
     
     def _prepare_request_params(self, table_name: str, query_params: Dict[str, Any]) -> Dict[str, Any]:
-        """쿼리 파라미터를 KOSIS API 요청 파라미터로 변환"""
-        endpoint = self._endpoints[table_name]
-        api_params = endpoint.parameters.copy()
+        """쿼리 파라미터를 KOSIS API 요청 파라미터로 변환
         
-        # 공통 파라미터 설정
+        format/jsonVD/searchYN 등 고정 파라미터는 엔드포인트 정의에 포함되어 있어 복사만 하고,
+        WHERE 조건은 테이블별 허용 키만 전달
+        """
+        api_params = self._endpoints[table_name].parameters.copy()
         api_params["apiKey"] = self._api_key
-        api_params["format"] = "json"
-        api_params["jsonVD"] = "Y"
         
-        # 테이블별 특수 파라미터 매핑
-        if table_name == "statistics_data":
-            # 통계 데이터 조회 파라미터 매핑
-            if "userStatsId" in query_params:
-                api_params["userStatsId"] = query_params["userStatsId"]
-            if "orgId" in query_params:
-                api_params["orgId"] = query_params["orgId"]
-            if "tblId" in query_params:
-                api_params["tblId"] = query_params["tblId"]
-            if "startPrdDe" in query_params:
-                api_params["startPrdDe"] = query_params["startPrdDe"]
-            if "endPrdDe" in query_params:
-                api_params["endPrdDe"] = query_params["endPrdDe"]
-            if "prdSe" in query_params:
-                api_params["prdSe"] = query_params["prdSe"]
-                
-        elif table_name == "statistics_list":
-            # 통계 목록 조회 파라미터 매핑
-            if "orgId" in query_params:
-                api_params["orgId"] = query_params["orgId"]
-            if "tblId" in query_params:
-                api_params["tblId"] = query_params["tblId"]
-                
-        elif table_name == "statistics_search":
-            # 검색 파라미터 매핑
-            if "searchNm" in query_params:
-                api_params["searchNm"] = query_params["searchNm"]
-            api_params["searchYN"] = "Y"
-            
-        elif table_name == "statistics_detail":
-            # 통계 설명 파라미터 매핑
-            if "orgId" in query_params:
-                api_params["orgId"] = query_params["orgId"]
-            if "tblId" in query_params:
-                api_params["tblId"] = query_params["tblId"]
+        for key in self._PARAM_KEYS[table_name]:
+            value = query_params.get(key)
+            if value is not None:
+                api_params[key] = value
         
         return api_params
     
     def _transform_statistics_data(self, data: Any) -> List[Dict[str, Any]]:
-        """통계 데이터 변환"""
+        """통계 데이터 변환 (빈 문자열 → None, 수치 컬럼 → int/float)"""
         if not isinstance(data, list):
             return []
         
-        transformed_data = []
-        for item in data:
-            # KOSIS API 응답 데이터 정규화
-            transformed_item = {}
-            for key, value in item.items():
-                # 빈 문자열을 None으로 변환
-                if value == "":
-                    value = None
-                # 숫자 값 변환
-                elif key == "DT" and value is not None:
-                    try:
-                        value = float(value) if '.' in str(value) else int(value)
-                    except (ValueError, TypeError):
-                        pass
-                
-                transformed_item[key] = value
-            
-            transformed_data.append(transformed_item)
-        
-        return transformed_data
+        return [
+            {
+                key: None if value == "" else (_parse_number(value) if key in _NUMERIC_COLS else value)
+                for key, value in item.items()
+            }
+            for item in data
+        ]
+    
+    async def _do_request(self, endpoint: APIEndpoint, api_params: Dict[str, Any]) -> Any:
+        """요청 속도 제어기를 거쳐 요청하고 응답 상태로 동시성 조정"""
+        limiter = self._rate_limiter
+        await limiter.acquire()
+        start = time.perf_counter()
+        status, headers = None, None
+        try:
+            result = await super()._do_request(endpoint, api_params)
+            status = 200
+            return result
+        except aiohttp.ClientResponseError as e:
+            status, headers = e.status, e.headers
+            raise
+        finally:
+            await limiter.release(status, headers, time.perf_counter() - start)
     
     async def test_connection(self) -> Tuple[bool, Optional[str]]:
         """KOSIS API 연결 테스트"""
         try:
-            start_time = time.time()
+            # 핸들러의 HTTP 세션 재사용 (연결 전이면 API 설정 초기화 후 생성, disconnect()에서 닫힘)
+            session = self._ensure_session()
             
             # KOSIS API 상태 확인용 간단한 요청
             test_params = {
@@ -282,22 +392,32 @@ class KOSISHandler(BaseAPIHandler):
                 "parentListId": "MT_ZTITLE"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self._base_url}/statisticsList.do",
-                    params=test_params
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        if "result" in result:
-                            latency = round((time.time() - start_time) * 1000, 2)
-                            message = f"KOSIS API connected successfully (Latency: {latency}ms)"
-                            return True, message
+            # 조회 요청과 같은 동시 요청 상한/속도 제어 적용
+            limiter = self._rate_limiter
+            async with self._inflight:
+                await limiter.acquire()
+                status, headers = None, None
+                # 대기 시간을 제외한 요청 지연만 측정 (대기열 지연으로 속도 제어기가 동시성을 줄이지 않도록)
+                start_time = time.perf_counter()
+                try:
+                    async with session.get(
+                        f"{self._base_url}/statisticsList.do",
+                        params=test_params
+                    ) as response:
+                        status, headers = response.status, response.headers
+                        if response.status == 200:
+                            result = orjson.loads(await response.read())
+                            if "result" in result:
+                                latency = round((time.perf_counter() - start_time) * 1000, 2)
+                                message = f"KOSIS API connected successfully (Latency: {latency}ms)"
+                                return True, message
+                            else:
+                                return False, "Invalid API key or access denied"
                         else:
-                            return False, "Invalid API key or access denied"
-                    else:
-                        return False, f"API returned status {response.status}"
-                        
+                            return False, f"API returned status {response.status}"
+                finally:
+                    await limiter.release(status, headers, time.perf_counter() - start_time)
+                    
         except Exception as e:
             return False, self.format_error(e)
     
@@ -306,26 +426,48 @@ class KOSISHandler(BaseAPIHandler):
         return "KOSIS OpenAPI v1.0"
     
     # KOSIS 전용 헬퍼 메서드들
+    async def _fetch_table(self, table_name: str, query_params: Dict[str, Any], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """SQL 생성/파싱 없이 테이블 조회 (헬퍼 메서드용, 실패 시 빈 목록)
+        
+        조건 값을 SQL 문자열로 만들지 않으므로 따옴표가 포함된 값도 그대로 전달됨
+        """
+        if not self.is_connected():
+            raise ConnectionError(f"Not connected to {self.api_name} API")
+        
+        try:
+            data = await self._execute_api_call(table_name, query_params)
+        except APIHandlerError as e:
+            self.logger.warning(f"{self.api_name} {table_name} request failed: {e}")
+            return []
+        return data[:limit] if limit is not None else data
+    
     async def search_statistics(self, keyword: str, limit: int = 10) -> List[Dict[str, Any]]:
         """통계 검색"""
-        query = f"SELECT * FROM statistics_search WHERE searchNm = '{keyword}' LIMIT {limit}"
-        result = await self.execute_query(query)
-        return result.data if result.success else []
+        return await self._fetch_table("statistics_search", {"searchNm": keyword}, limit)
     
     async def get_statistics_by_table_id(self, org_id: str, tbl_id: str, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
         """테이블 ID로 통계 데이터 조회"""
-        where_clause = f"orgId = '{org_id}' AND tblId = '{tbl_id}'"
+        query_params = {"orgId": org_id, "tblId": tbl_id}
         if start_date:
-            where_clause += f" AND startPrdDe = '{start_date}'"
+            query_params["startPrdDe"] = start_date
         if end_date:
-            where_clause += f" AND endPrdDe = '{end_date}'"
-            
-        query = f"SELECT * FROM statistics_data WHERE {where_clause}"
-        result = await self.execute_query(query)
-        return result.data if result.success else []
+            query_params["endPrdDe"] = end_date
+        return await self._fetch_table("statistics_data", query_params)
+    
+    async def get_statistics_batch(self, pairs: List[Tuple[str, str]], start_date: str = None, end_date: str = None) -> List[List[Dict[str, Any]]]:
+        """여러 (orgId, tblId) 통계 데이터를 동시에 조회 (결과는 pairs 순서, 실패한 항목은 빈 목록)
+        
+        동시 요청 수는 핸들러의 요청 상한과 속도 제어기로 제한됨
+        """
+        if not self.is_connected():
+            raise ConnectionError(f"Not connected to {self.api_name} API")
+        
+        return await asyncio.gather(*(
+            self.get_statistics_by_table_id(org_id, tbl_id, start_date, end_date)
+            for org_id, tbl_id in pairs
+        ))
     
     async def get_statistics_metadata(self, org_id: str, tbl_id: str) -> Dict[str, Any]:
         """통계 메타데이터 조회"""
-        query = f"SELECT * FROM statistics_detail WHERE orgId = '{org_id}' AND tblId = '{tbl_id}'"
-        result = await self.execute_query(query)
-        return result.data[0] if result.success and result.data else {} 
\ No newline at end of file
+        data = await self._fetch_table("statistics_detail", {"orgId": org_id, "tblId": tbl_id}, 1)
+        return data[0] if data else {}
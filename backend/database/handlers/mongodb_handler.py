@@ -32,6 +32,23 @@ from .base_handler import (
 )
 
 
+# 직렬화 없이 그대로 반환 가능한 스칼라 타입 (정확한 타입 일치로 판별)
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# 정확한 타입 → BSON 타입명 (정확한 일치이므로 bool이 int로 분류되지 않음)
+_BSON_TYPE_NAMES = {
+    str: 'string',
+    int: 'int',
+    float: 'double',
+    bool: 'bool',
+    list: 'array',
+    dict: 'object',
+    type(None): 'null',
+}
+if MONGODB_AVAILABLE:
+    _BSON_TYPE_NAMES[ObjectId] = 'ObjectId'
+
+
 class MongoDBHandler(BaseDatabaseHandler):
     """MongoDB 데이터베이스 핸들러"""
     
@@ -106,6 +123,8 @@ class MongoDBHandler(BaseDatabaseHandler):
                     self._database = self._client['test']  # 기본값
                     self.config.database = 'test'
             
+            # connection 속성을 설정하여 is_connected()가 올바르게 작동하도록 함
+            self.connection = self._client
             self._set_status(ConnectionStatus.CONNECTED)
             self.logger.info(f"Connected to MongoDB: {self.config.host}:{self.config.port}/{self.config.database}")
             return True
@@ -124,6 +143,7 @@ class MongoDBHandler(BaseDatabaseHandler):
                 self._client = None
                 self._database = None
             
+            self.connection = None
             self._set_status(ConnectionStatus.DISCONNECTED)
             self.logger.info("Disconnected from MongoDB")
             return True
@@ -442,16 +462,21 @@ class MongoDBHandler(BaseDatabaseHandler):
     
     def _get_bson_type(self, value) -> str:
         """BSON 값의 타입 반환"""
+        bson_type = _BSON_TYPE_NAMES.get(type(value))
+        if bson_type is not None:
+            return bson_type
+        
+        # 서브클래스 등 정확히 일치하지 않는 타입
         if isinstance(value, ObjectId):
             return 'ObjectId'
         elif isinstance(value, str):
             return 'string'
+        elif isinstance(value, bool):
+            return 'bool'
         elif isinstance(value, int):
             return 'int'
         elif isinstance(value, float):
             return 'double'
-        elif isinstance(value, bool):
-            return 'bool'
         elif isinstance(value, list):
             return 'array'
         elif isinstance(value, dict):
@@ -468,7 +493,10 @@ class MongoDBHandler(BaseDatabaseHandler):
         
         serialized = {}
         for key, value in doc.items():
-            if isinstance(value, ObjectId):
+            if type(value) in _SCALAR_TYPES:
+                # 대부분의 필드는 변환이 필요없는 스칼라 (isinstance 분기 생략)
+                serialized[key] = value
+            elif isinstance(value, ObjectId):
                 serialized[key] = str(value)
             elif isinstance(value, dict):
                 serialized[key] = self._serialize_document(value)
@@ -28,6 +28,15 @@ from .base_handler import (
 )
 
 
+# 연결 파라미터가 아닌 풀 크기 옵션
+_POOL_SIZE_OPTIONS = frozenset({'min_size', 'max_size'})
+
+
+def _connection_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """드라이버에 그대로 전달할 연결 옵션 (풀 크기 옵션 제외)"""
+    return {k: v for k, v in options.items() if k not in _POOL_SIZE_OPTIONS}
+
+
 class MySQLHandler(BaseDatabaseHandler):
     """MySQL 데이터베이스 핸들러"""
     
@@ -55,7 +64,8 @@ class MySQLHandler(BaseDatabaseHandler):
         try:
             self._set_status(ConnectionStatus.CONNECTING)
             
-            # 연결 풀 생성
+            # 연결 풀 생성 (풀 크기는 options의 min_size/max_size로 조정)
+            options = self.config.options
             self._pool = await aiomysql.create_pool(
                 host=self.config.host or 'localhost',
                 port=self.config.port or 3306,
@@ -65,9 +75,9 @@ class MySQLHandler(BaseDatabaseHandler):
                 charset='utf8mb4',
                 cursorclass=aiomysql.DictCursor,
                 autocommit=True,
-                minsize=1,
-                maxsize=10,
-                **self.config.options
+                minsize=options.get('min_size', 1),
+                maxsize=options.get('max_size', 10),
+                **_connection_options(options)
             )
             
             # 연결 테스트
@@ -76,6 +86,8 @@ class MySQLHandler(BaseDatabaseHandler):
                     await cursor.execute("SELECT 1")
                     result = await cursor.fetchone()
                     
+            # connection 속성을 설정하여 is_connected()가 올바르게 작동하도록 함
+            self.connection = self._pool
             self._set_status(ConnectionStatus.CONNECTED)
             self.logger.info(f"Connected to MySQL: {self.config.host}:{self.config.port}/{self.config.database}")
             return True
@@ -94,6 +106,7 @@ class MySQLHandler(BaseDatabaseHandler):
                 await self._pool.wait_closed()
                 self._pool = None
             
+            self.connection = None
             self._set_status(ConnectionStatus.DISCONNECTED)
             self.logger.info("Disconnected from MySQL")
             return True
@@ -115,7 +128,7 @@ class MySQLHandler(BaseDatabaseHandler):
                 password=self.config.password,
                 db=self.config.database,
                 charset='utf8mb4',
-                **self.config.options
+                **_connection_options(self.config.options)
             )
             
             async with conn.cursor() as cursor:
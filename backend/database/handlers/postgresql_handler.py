@@ -4,6 +4,7 @@ PostgreSQL 데이터베이스 전용 핸들러
 """
 
 import asyncio
+import ssl
 import time
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -28,6 +29,10 @@ from .base_handler import (
 )
 
 
+# 연결 파라미터가 아닌 옵션 (schema는 논리적 개념, min_size/max_size는 풀 크기)
+_NON_CONNECTION_OPTIONS = frozenset({'schema', 'min_size', 'max_size'})
+
+
 class PostgreSQLHandler(BaseDatabaseHandler):
     """PostgreSQL 데이터베이스 핸들러"""
     
@@ -53,7 +58,7 @@ class PostgreSQLHandler(BaseDatabaseHandler):
     
     def is_connected(self) -> bool:
         """PostgreSQL 연결 상태 확인 (오버라이드)"""
-        return (self.status == ConnectionStatus.CONNECTED and 
+        return (self.status is ConnectionStatus.CONNECTED and 
                 self._pool is not None and 
                 not self._pool._closed)
     
@@ -68,23 +73,22 @@ class PostgreSQLHandler(BaseDatabaseHandler):
             # SSL 설정
             ssl_context = None
             if self.config.ssl:
-                import ssl
                 ssl_context = ssl.create_default_context()
                 ssl_context.check_hostname = False
                 ssl_context.verify_mode = ssl.CERT_NONE
             
-            # PostgreSQL 연결 옵션 필터링 (schema 제외)
+            # PostgreSQL 연결 옵션 필터링 (schema, 풀 크기 제외)
             connection_options = {
                 k: v for k, v in self.config.options.items() 
-                if k not in ['schema']  # schema는 논리적 개념이므로 연결 파라미터에서 제외
+                if k not in _NON_CONNECTION_OPTIONS
             }
             
             # 연결 풀 생성
             self._pool = await asyncpg.create_pool(
                 dsn,
                 ssl=ssl_context,
-                min_size=1,
-                max_size=10,
+                min_size=self.config.options.get('min_size', 1),
+                max_size=self.config.options.get('max_size', 10),
                 command_timeout=60,
                 **connection_options
             )
@@ -133,15 +137,14 @@ class PostgreSQLHandler(BaseDatabaseHandler):
             # SSL 설정
             ssl_context = None
             if self.config.ssl:
-                import ssl
                 ssl_context = ssl.create_default_context()
                 ssl_context.check_hostname = False
                 ssl_context.verify_mode = ssl.CERT_NONE
             
-            # PostgreSQL 연결 옵션 필터링 (schema 제외)
+            # PostgreSQL 연결 옵션 필터링 (schema, 풀 크기 제외)
             connection_options = {
                 k: v for k, v in self.config.options.items() 
-                if k not in ['schema']  # schema는 논리적 개념이므로 연결 파라미터에서 제외
+                if k not in _NON_CONNECTION_OPTIONS
             }
             
             # 임시 연결로 테스트
@@ -24,6 +24,11 @@ from .base_handler import (
 )
 
 
+def _quote_identifier(name: str) -> str:
+    """SQLite 식별자 인용 (내부의 큰따옴표는 두 번 써서 이스케이프)"""
+    return '"' + name.replace('"', '""') + '"'
+
+
 class SQLiteHandler(BaseDatabaseHandler):
     """SQLite 데이터베이스 핸들러"""
     
@@ -31,6 +36,8 @@ class SQLiteHandler(BaseDatabaseHandler):
         super().__init__(config)
         self._connection = None
         self._db_path = config.database
+        # 테이블별 COUNT 쿼리 문자열 캐시 (이스케이프 1회, 동일 SQL 텍스트 → 문장 캐시 재사용)
+        self._count_sql: Dict[str, str] = {}
     
     @property
     def type(self) -> DatabaseType:
@@ -58,14 +65,18 @@ class SQLiteHandler(BaseDatabaseHandler):
             if db_dir and not os.path.exists(db_dir):
                 os.makedirs(db_dir)
             
-            # 연결 생성
-            self._connection = await aiosqlite.connect(self._db_path)
-            self._connection.row_factory = aiosqlite.Row  # 딕셔너리 형태로 결과 반환
+            # 연결 생성 (반복되는 SQL 텍스트는 sqlite3 문장 캐시에서 재사용)
+            self._connection = await aiosqlite.connect(
+                self._db_path,
+                cached_statements=self.config.options.get('cached_statements', 256)
+            )
             
             # 연결 테스트
             async with self._connection.execute("SELECT 1") as cursor:
                 result = await cursor.fetchone()
             
+            # connection 속성을 설정하여 is_connected()가 올바르게 작동하도록 함
+            self.connection = self._connection
             self._set_status(ConnectionStatus.CONNECTED)
             self.logger.info(f"Connected to SQLite: {self._db_path}")
             return True
@@ -80,9 +91,16 @@ class SQLiteHandler(BaseDatabaseHandler):
         """SQLite 연결 해제"""
         try:
             if self._connection:
+                try:
+                    # 세션 동안 수집된 통계로 쿼리 플래너 정보 갱신 (종료 시 1회)
+                    await self._connection.execute("PRAGMA optimize")
+                except Exception as e:
+                    self.logger.warning(f"SQLite PRAGMA optimize failed: {e}")
                 await self._connection.close()
                 self._connection = None
             
+            self._count_sql.clear()
+            self.connection = None
             self._set_status(ConnectionStatus.DISCONNECTED)
             self.logger.info("Disconnected from SQLite")
             return True
@@ -114,7 +132,31 @@ class SQLiteHandler(BaseDatabaseHandler):
             return False, self.format_error(e)
     
     async def execute_query(self, query: str, params: Optional[Dict] = None) -> QueryResult:
-        """SQLite 쿼리 실행"""
+        """SQLite 쿼리 실행 (SELECT 결과는 options.max_rows로 상한)"""
+        return await self._execute(query, params, commit=True, max_rows=self.config.options.get('max_rows'))
+    
+    async def execute_multiple_queries(self, queries: List[str]) -> List[QueryResult]:
+        """여러 쿼리를 단일 커밋으로 실행 (에러 발생시 성공한 쿼리까지 커밋 후 중단)"""
+        results = []
+        try:
+            for query in queries:
+                result = await self._execute(
+                    query, None, commit=False, max_rows=self.config.options.get('max_rows')
+                )
+                results.append(result)
+                if not result.success:
+                    break  # 에러 발생시 중단
+        finally:
+            if self._connection:
+                await self._connection.commit()
+        return results
+    
+    async def _introspect(self, query: str, params: Optional[Dict] = None) -> QueryResult:
+        """내부 메타데이터 조회 (테이블/컬럼 목록이 잘리지 않도록 max_rows 미적용)"""
+        return await self._execute(query, params, commit=False)
+    
+    async def _execute(self, query: str, params: Optional[Dict], commit: bool, max_rows: Optional[int] = None) -> QueryResult:
+        """쿼리 실행 본체 (commit=False면 쓰기 쿼리 커밋을 호출자에게 위임, max_rows는 SELECT 결과 상한)"""
         if not self.is_connected():
             raise ConnectionError("Not connected to SQLite")
         
@@ -131,21 +173,22 @@ class SQLiteHandler(BaseDatabaseHandler):
             # 쿼리 실행
             if query.strip().upper().startswith(('SELECT', 'WITH', 'PRAGMA')):
                 # SELECT 쿼리
-                if params:
-                    async with self._connection.execute(query, params) as cursor:
-                        rows = await cursor.fetchall()
-                else:
-                    async with self._connection.execute(query) as cursor:
+                async with self._connection.execute(query, params) as cursor:
+                    if max_rows:
+                        # 상한 + 1행만 가져와 잘림 여부 판별 (대용량 결과의 메모리 상한)
+                        rows = await cursor.fetchmany(max_rows + 1)
+                    else:
                         rows = await cursor.fetchall()
+                    description = cursor.description
                 
-                if rows:
-                    columns = list(rows[0].keys())
-                    data = [dict(row) for row in rows]
-                    row_count = len(data)
-                else:
-                    columns = []
-                    data = []
-                    row_count = 0
+                truncated = bool(max_rows) and len(rows) > max_rows
+                if truncated:
+                    rows = rows[:max_rows]
+                
+                # 컬럼명은 cursor.description에서 1회만 추출 (빈 결과에도 유지)
+                columns = [desc[0] for desc in description] if description else []
+                data = [dict(zip(columns, row)) for row in rows]
+                row_count = len(data)
             else:
                 # INSERT/UPDATE/DELETE 쿼리
                 if params:
@@ -153,11 +196,13 @@ class SQLiteHandler(BaseDatabaseHandler):
                 else:
                     cursor = await self._connection.execute(query)
                 
-                await self._connection.commit()
+                if commit:
+                    await self._connection.commit()
                 
                 columns = []
                 data = []
                 row_count = cursor.rowcount
+                truncated = False
                 
                 await cursor.close()
             
@@ -170,7 +215,7 @@ class SQLiteHandler(BaseDatabaseHandler):
                 columns=columns,
                 row_count=row_count,
                 execution_time=execution_time,
-                metadata={"affected_rows": row_count}
+                metadata={"affected_rows": row_count, "truncated": truncated}
             )
             
         except Exception as e:
@@ -198,7 +243,7 @@ class SQLiteHandler(BaseDatabaseHandler):
             ORDER BY name
             """
             
-            result = await self.execute_query(query)
+            result = await self._introspect(query)
             if not result.success:
                 raise SchemaError(f"Failed to get tables: {result.error}")
             
@@ -207,12 +252,7 @@ class SQLiteHandler(BaseDatabaseHandler):
                 # 행 수 조회
                 row_count = None
                 if row['type'] == 'table':
-                    try:
-                        count_result = await self.execute_query(f'SELECT COUNT(*) as count FROM "{row["name"]}"')
-                        if count_result.success and count_result.data:
-                            row_count = count_result.data[0]['count']
-                    except:
-                        pass
+                    row_count = await self._count_rows(row['name'])
                 
                 table_info = TableInfo(
                     name=row['name'],
@@ -260,7 +300,7 @@ class SQLiteHandler(BaseDatabaseHandler):
             WHERE name = ? AND type IN ('table', 'view')
             """
             
-            result = await self.execute_query(query, {"name": table_name})
+            result = await self._introspect(query, {"name": table_name})
             if not result.success or not result.data:
                 raise SchemaError(f"Table {table_name} not found")
             
@@ -269,12 +309,7 @@ class SQLiteHandler(BaseDatabaseHandler):
             # 행 수 조회
             row_count = None
             if row['type'] == 'table':
-                try:
-                    count_result = await self.execute_query(f'SELECT COUNT(*) as count FROM "{table_name}"')
-                    if count_result.success and count_result.data:
-                        row_count = count_result.data[0]['count']
-                except:
-                    pass
+                row_count = await self._count_rows(table_name)
             
             table_info = TableInfo(
                 name=row['name'],
@@ -292,11 +327,26 @@ class SQLiteHandler(BaseDatabaseHandler):
         except Exception as e:
             raise SchemaError(f"Failed to get SQLite table info: {e}")
     
+    async def _count_rows(self, table_name: str) -> Optional[int]:
+        """테이블 행 수 조회 (캐시된 COUNT 쿼리를 커넥션에서 직접 실행)"""
+        sql = self._count_sql.get(table_name)
+        if sql is None:
+            sql = self._count_sql[table_name] = f"SELECT COUNT(*) FROM {_quote_identifier(table_name)}"
+        
+        try:
+            async with self._connection.execute(sql) as cursor:
+                result = await cursor.fetchone()
+            return result[0] if result else None
+        except Exception:
+            return None
+    
     async def _get_table_columns(self, table_name: str) -> List[Dict[str, Any]]:
         """테이블 컬럼 정보 조회"""
         try:
-            query = f"PRAGMA table_info('{table_name}')"
-            result = await self.execute_query(query)
+            # 테이블명은 바인딩 파라미터로 전달 (이스케이프 불필요, 동일 SQL 텍스트 재사용)
+            result = await self._introspect(
+                "SELECT * FROM pragma_table_info(:name)", {"name": table_name}
+            )
             
             if not result.success:
                 return []
@@ -13,6 +13,8 @@ import sys
 from .api.database_api import router as database_router
 from .api.agent_api import router as agent_router
 from .database.connection_manager import get_connection_manager
+from .database.handlers.handler_factory import get_supported_databases
+from .agent import close_client as close_agent_client
 
 
 # 로깅 설정
@@ -34,8 +36,10 @@ async def lifespan(app: FastAPI):
     logger.info("Starting MindsDB-inspired Multi-Database System")
     
     try:
-        # 연결 매니저 초기화
+        # 연결 매니저 초기화 (저장된 연결 로드 후 app.state로 공유)
         connection_manager = get_connection_manager()
+        await connection_manager.initialize()
+        app.state.db_manager = connection_manager
         logger.info("Connection Manager initialized successfully")
         
         # 라우터 등록 확인 
@@ -56,6 +60,12 @@ async def lifespan(app: FastAPI):
         logger.info("All database connections closed successfully")
     except Exception as e:
         logger.error(f"Error closing connections: {e}")
+    
+    # LLM 클라이언트 HTTP 연결 해제
+    try:
+        await close_agent_client()
+    except Exception as e:
+        logger.error(f"Error closing agent client: {e}")
 
 
 # FastAPI 앱 생성
@@ -133,8 +143,6 @@ async def health_check():
 @app.get("/api/info")
 async def api_info():
     """API 정보 엔드포인트"""
-    from .database.handlers.handler_factory import get_supported_databases
-    
     try:
         supported_dbs = get_supported_databases()
         
@@ -160,5 +168,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="auto",  # uvloop 설치 시(uvicorn[standard], Windows 제외) uvloop 이벤트 루프 사용
         log_level="info"
     ) 
\ No newline at end of file
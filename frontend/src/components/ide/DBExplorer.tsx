@@ -27,6 +27,7 @@ type ConnectionStatus = 'connected' | 'disconnected' | 'loading';
 
 export default function DBExplorer({ onTableSelect, onQueryGenerate, currentConnection }: DBExplorerProps) {
   const [schema, setSchema] = useState<DatabaseSchema | null>(null);
+  const [connections, setConnections] = useState<any[]>([]);
   const [loading, setLoading] = useState(false);
   const [connectionStatus, setConnectionStatus] = useState<ConnectionStatus>('disconnected');
   const [expandedTables, setExpandedTables] = useState<Set<string>>(new Set());
@@ -34,13 +35,43 @@ export default function DBExplorer({ onTableSelect, onQueryGenerate, currentConn
 
   useEffect(() => {
     if (currentConnection?.isActive) {
-      loadSchema();
+      loadBootstrap();
     } else {
       setSchema(null);
       setConnectionStatus('disconnected');
     }
   }, [currentConnection]);
 
+  // 첫 화면: 연결 목록, 연결 상태, 스키마를 /bootstrap 한 번의 요청으로 조회
+  const loadBootstrap = async () => {
+    if (!currentConnection) {
+      setConnectionStatus('disconnected');
+      return;
+    }
+
+    setLoading(true);
+    setConnectionStatus('loading');
+    try {
+      const data = await databaseAPI.getBootstrap(currentConnection.id);
+      setConnections(data.connections || []);
+
+      const info = (data.connections || []).find((conn: any) => conn.id === currentConnection.id);
+      if (data.schema && data.schema.tables && info?.status !== 'error') {
+        setSchema(data.schema);
+        setConnectionStatus('connected');
+      } else {
+        setSchema(null);
+        setConnectionStatus('disconnected');
+      }
+    } catch (error) {
+      console.error('초기 데이터 로드 실패:', error);
+      setConnectionStatus('disconnected');
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  // 새로고침: 스키마만 다시 조회
   const loadSchema = async () => {
     if (!currentConnection) {
       setConnectionStatus('disconnected');
@@ -319,6 +350,9 @@ export default function DBExplorer({ onTableSelect, onQueryGenerate, currentConn
           {connectionStatus === 'connected' && schema && (
             <span>{schema.tables.length} tables</span>
           )}
+          {connections.length > 0 && (
+            <span>· {connections.length} conn</span>
+          )}
         </div>
       </div>
     </div>
@@ -117,10 +117,9 @@ export const databaseAPI = {
   // 스키마 조회
   getSchema: async (connectionId?: string): Promise<any> => {
     try {
-      const url = connectionId 
-        ? `/api/database/schema?connectionId=${connectionId}`
-        : '/api/database/schema';
-      const response = await databaseApiClient.get(url);
+      const response = await databaseApiClient.get('/api/database/schema', {
+        params: connectionId ? { connection_id: connectionId } : undefined
+      });
       return response.data;
     } catch (error) {
       console.error('스키마 조회 실패:', error);
@@ -128,6 +127,19 @@ export const databaseAPI = {
     }
   },
 
+  // 초기 화면용 일괄 조회 (연결 목록 + 스키마 + 통계를 한 번의 요청으로)
+  getBootstrap: async (connectionId?: string): Promise<{ connections: any[]; schema: any | null; stats: any }> => {
+    try {
+      const response = await databaseApiClient.get('/api/database/bootstrap', {
+        params: connectionId ? { connection_id: connectionId } : undefined
+      });
+      return response.data;
+    } catch (error) {
+      console.error('초기 데이터 조회 실패:', error);
+      throw error;
+    }
+  },
+
   // 쿼리 실행
   executeQuery: async (query: string, connectionId?: string): Promise<any> => {
     try {
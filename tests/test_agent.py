@@ -1,11 +1,8 @@
-import os
-import sys
 import asyncio
+import importlib
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-import importlib
-nl2sql = importlib.import_module("backend.agent.nl2sql")
+from backend.agent.nl2sql import nl2sql
 
 class DummyResponse:
     class Choice:
@@ -15,5 +12,98 @@ class DummyResponse:
         self.choices = [self.Choice(content)]
 
 def test_nl2sql_returns_default_sql():
-    sql = asyncio.run(nl2sql.nl2sql("show users"))
+    sql = asyncio.run(nl2sql("show users"))
     assert sql == "SELECT 1"
+
+
+class DummyStream:
+    def __init__(self, parts):
+        self._parts = list(parts)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._parts:
+            raise StopAsyncIteration
+        delta = type('delta', (), {'content': self._parts.pop(0)})
+        return type('chunk', (), {'choices': [type('choice', (), {'delta': delta})]})
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeStreamingClient:
+    def __init__(self, parts):
+        self.parts = parts
+        self.calls = []
+        self.streams = []
+        self.chat = self
+        self.completions = self
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        stream = DummyStream(self.parts)
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def streaming_client(monkeypatch):
+    """청크 목록을 받아 매 호출마다 그 청크를 스트리밍하는 가짜 OpenAI 클라이언트를 설치"""
+    module = importlib.import_module("backend.agent.nl2sql")
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(module, "openai", object())
+    monkeypatch.setattr(module, "_sql_cache", module.OrderedDict())
+
+    def install(*parts):
+        client = FakeStreamingClient(parts)
+        monkeypatch.setattr(module, "_get_client", lambda api_key: client)
+        return client
+
+    return install
+
+
+def test_nl2sql_stops_streaming_at_statement_end(streaming_client):
+    client = streaming_client("SELECT name FROM users WHERE note = 'a;", "b'", "; -- done", " extra")
+
+    sql = asyncio.run(nl2sql("show notes"))
+    assert sql == "SELECT name FROM users WHERE note = 'a;b';"
+    assert client.calls[0]["stream"] is True
+    assert client.streams[0]._parts == [" extra"]
+    assert client.streams[0].closed
+
+
+def test_nl2sql_ignores_quotes_before_sql(streaming_client):
+    client = streaming_client("Here's the query:\n```sql\n", "SELECT * FROM t WHERE name = 'a;b'", ";\n```", " Hope it helps")
+
+    sql = asyncio.run(nl2sql("find a;b"))
+    assert sql == "SELECT * FROM t WHERE name = 'a;b';"
+    assert client.streams[0]._parts == [" Hope it helps"]
+
+
+@pytest.mark.parametrize("preamble", [
+    ("With the given schema, here's the query:\n",),
+    ("Show", "ing the query, it's below:\n"),
+])
+def test_nl2sql_ignores_sql_like_prose_before_sql(streaming_client, preamble):
+    client = streaming_client(*preamble, "SELECT * FROM t WHERE name = 'a;b'", ";", " Hope it helps")
+
+    sql = asyncio.run(nl2sql("find a;b"))
+    assert sql == "SELECT * FROM t WHERE name = 'a;b';"
+    assert client.streams[0]._parts == [" Hope it helps"]
+
+
+def test_nl2sql_caches_repeated_questions(streaming_client):
+    client = streaming_client("SELECT 2;")
+
+    assert asyncio.run(nl2sql("count  users")) == "SELECT 2;"
+    assert asyncio.run(nl2sql(" count users ")) == "SELECT 2;"
+    assert len(client.calls) == 1
+
+
+def test_clean_sql_strips_fences_and_preamble():
+    module = importlib.import_module("backend.agent.nl2sql")
+    text = "Here is the query:\n```sql\nSELECT * FROM users;"
+    assert module._clean_sql(text) == "SELECT * FROM users;"
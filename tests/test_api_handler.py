@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("cryptography")
+aiohttp = pytest.importorskip("aiohttp")
+yarl = pytest.importorskip("yarl")
+
+from backend.database.handlers import api_handler
+from backend.database.handlers.api_handler import APIEndpoint, APITable, BaseAPIHandler
+from backend.database.handlers.base_handler import ConnectionConfig, DatabaseType
+
+
+class FakeAPIHandler(BaseAPIHandler):
+    def __init__(self, responses, cache_ttl=60.0):
+        super().__init__(ConnectionConfig(id="fake", name="fake", type=DatabaseType.EXTERNAL_API))
+        self.responses = list(responses)
+        self.cache_ttl = cache_ttl
+        self.requests = []
+
+    @property
+    def api_name(self):
+        return "Fake"
+
+    @property
+    def supported_operations(self):
+        return ["SELECT"]
+
+    def _initialize_endpoints(self):
+        endpoint = APIEndpoint(name="items", url="http://fake/items", cache_ttl=self.cache_ttl)
+        self._endpoints["items"] = endpoint
+        self._tables["items"] = APITable(name="items", endpoint=endpoint, columns=[{"name": "v"}], data_path="data")
+
+    def _prepare_request_params(self, table_name, query_params):
+        return dict(query_params)
+
+    async def _do_request(self, endpoint, api_params):
+        self.requests.append(api_params)
+        response = self.responses.pop(0)
+        if isinstance(response, BaseException):
+            raise response
+        return {"data": [{"v": response}]}
+
+
+def response_error(status):
+    url = yarl.URL("http://fake/items")
+    request_info = aiohttp.RequestInfo(url, "GET", {}, url)
+    return aiohttp.ClientResponseError(request_info, (), status=status, message="error")
+
+
+def run_queries(handler, queries, delay=0.0):
+    async def run():
+        await handler.connect()
+        results = []
+        for query in queries:
+            results.append(await handler.execute_query(query))
+            await asyncio.sleep(delay)
+        await handler.disconnect()
+        return results
+
+    return asyncio.run(run())
+
+
+def test_responses_are_cached_within_ttl():
+    handler = FakeAPIHandler([1, 2])
+    results = run_queries(handler, ["SELECT * FROM items WHERE q = 'a'"] * 2)
+    assert [r.data for r in results] == [[{"v": 1}], [{"v": 1}]]
+    assert len(handler.requests) == 1
+
+
+def test_expired_responses_are_refetched():
+    handler = FakeAPIHandler([1, 2], cache_ttl=0.01)
+    results = run_queries(handler, ["SELECT * FROM items WHERE q = 'a'"] * 2, delay=0.02)
+    assert [r.data for r in results] == [[{"v": 1}], [{"v": 2}]]
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(api_handler, "_RESPONSE_CACHE_SIZE", 2)
+    handler = FakeAPIHandler([1, 2, 3, 4])
+    queries = [f"SELECT * FROM items WHERE q = '{q}'" for q in ("a", "b", "a", "c", "a", "b")]
+    results = run_queries(handler, queries)
+    assert [r.data[0]["v"] for r in results] == [1, 2, 1, 3, 1, 4]
+
+
+@pytest.mark.parametrize("error", [asyncio.TimeoutError(), aiohttp.ClientConnectionError(), response_error(503)])
+def test_stale_response_served_on_outage(error):
+    handler = FakeAPIHandler([1, error], cache_ttl=0.01)
+    results = run_queries(handler, ["SELECT * FROM items WHERE q = 'a'"] * 2, delay=0.02)
+    assert results[1].success
+    assert results[1].data == [{"v": 1}]
+
+
+def test_client_errors_are_not_masked_by_stale_response():
+    handler = FakeAPIHandler([1, response_error(401)], cache_ttl=0.01)
+    results = run_queries(handler, ["SELECT * FROM items WHERE q = 'a'"] * 2, delay=0.02)
+    assert not results[1].success
+    assert "401" in results[1].error
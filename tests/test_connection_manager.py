@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("cryptography")
+pytest.importorskip("aiohttp")
+
+from backend.database import connection_manager as manager_module
+from backend.database.connection_manager import ConnectionManager
+
+
+class FakeHandler:
+    def __init__(self, name, connect_delay=0.01):
+        self.config = type('config', (), {'name': name})()
+        self.connect_delay = connect_delay
+        self.connected = False
+        self.connect_calls = 0
+
+    def is_connected(self):
+        return self.connected
+
+    async def connect(self):
+        self.connect_calls += 1
+        await asyncio.sleep(self.connect_delay)
+        self.connected = True
+        return True
+
+    async def disconnect(self):
+        await asyncio.sleep(0.01)
+        self.connected = False
+        return True
+
+    async def test_connection(self):
+        return self.connected, None
+
+
+def make_manager(**handlers):
+    manager = ConnectionManager()
+    manager._initialized = True
+    manager._lock = asyncio.Lock()
+    manager._mark_dirty = lambda: None
+    for connection_id, handler in handlers.items():
+        manager._connections[connection_id] = handler
+        manager._index_name(handler.config.name, connection_id)
+    return manager
+
+
+def test_waiters_do_not_reconnect_removed_connection():
+    async def run():
+        handler = FakeHandler("a")
+        manager = make_manager(x=handler)
+        # 첫 refresh가 잠금을 잡은 동안 remove와 나머지 호출이 대기
+        results = await asyncio.gather(
+            manager.refresh_connection("x"),
+            manager.remove_connection("x"),
+            manager.refresh_connection("x"),
+            manager.set_active_connection("x"),
+        )
+        return manager, handler, results
+
+    manager, handler, results = asyncio.run(run())
+    assert results == [True, True, False, False]
+    assert handler.connect_calls == 1 and not handler.connected
+    assert manager._active_connection_id is None
+    assert manager._conn_locks == {}
+
+
+class FakeStorage:
+    def __init__(self, configs):
+        self.configs = configs
+
+    async def load_connections(self):
+        return self.configs
+
+    async def save_connections(self, configs):
+        pass
+
+
+def test_hanging_warm_up_does_not_block_initialization(monkeypatch):
+    handlers = {"fast": FakeHandler("fast"), "slow": FakeHandler("slow", connect_delay=3600)}
+    configs = {
+        name: type('config', (), {'name': name, 'type': type('type', (), {'value': 'sqlite'})()})()
+        for name in handlers
+    }
+    monkeypatch.setattr(manager_module, "create_handler", lambda config: handlers[config.name])
+    monkeypatch.setattr(manager_module, "_WARMUP_TIMEOUT_SECONDS", 0.05)
+
+    async def run():
+        manager = ConnectionManager()
+        manager._storage = FakeStorage(configs)
+        await asyncio.wait_for(manager.initialize(), 1)
+        assert set(manager._connections) == {"fast", "slow"}
+        await asyncio.wait_for(manager._warmup_task, 1)
+
+    asyncio.run(run())
+    assert handlers["fast"].connected
+    assert not handlers["slow"].connected
+
+
+def test_duplicate_names_survive_removal():
+    async def run():
+        first, second = FakeHandler("dup"), FakeHandler("dup")
+        manager = make_manager(x=first, y=second)
+        assert manager.get_connection_by_name("dup") is first
+        assert await manager.remove_connection("x")
+        assert manager.get_connection_by_name("dup") is second
+        assert await manager.remove_connection("y")
+        return manager
+
+    manager = asyncio.run(run())
+    assert manager.get_connection_by_name("dup") is None
+    assert manager._name_index == {}
+
+
+def test_health_check_bypasses_cached_status():
+    async def run():
+        handler = FakeHandler("a")
+        manager = make_manager(x=handler)
+        assert await manager.set_active_connection("x")
+        manager._health["x"] = (manager_module.time.monotonic(), True)
+        handler.connected = False  # 캐시 TTL 내에 연결이 끊김
+        return manager, await manager.check_all_connections()
+
+    manager, results = asyncio.run(run())
+    assert results == {"x": False}
+    assert manager._health["x"][1] is False
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("cryptography")
+pytest.importorskip("aiosqlite")
+
+from backend.database.handlers.base_handler import ConnectionConfig, DatabaseType
+from backend.database.handlers.sqlite_handler import SQLiteHandler
+
+
+def test_max_rows_caps_user_queries_but_not_schema_listing(tmp_path):
+    config = ConnectionConfig(
+        id="sqlite", name="sqlite", type=DatabaseType.SQLITE,
+        database=str(tmp_path / "test.db"), options={"max_rows": 2},
+    )
+
+    async def run():
+        handler = SQLiteHandler(config)
+        assert await handler.connect()
+        try:
+            for name in ("a", "b", "c"):
+                await handler.execute_query(f"CREATE TABLE {name} (x INTEGER, y TEXT, z REAL)")
+            user_result = await handler.execute_query("SELECT name FROM sqlite_master WHERE type = 'table'")
+            tables = await handler.get_tables()
+            return user_result, tables
+        finally:
+            await handler.disconnect()
+
+    user_result, tables = asyncio.run(run())
+    assert user_result.row_count == 2
+    assert user_result.metadata["truncated"] is True
+    assert [table.name for table in tables] == ["a", "b", "c"]
+    assert all(len(table.columns) == 3 for table in tables)